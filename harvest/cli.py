@@ -27,6 +27,7 @@ from .team import (
     generate_recruited_section,
     generate_team_asciidoc,
     generate_person_page,
+    DEFAULT_SHEET_CACHE_DIR,
     DEFAULT_SHEET_ID,
     DEFAULT_SHEET_NAME,
 )
@@ -100,12 +101,16 @@ def harvest_team(args: argparse.Namespace) -> int:
     """Run team/recruited personnel harvesting."""
     # Use unified config if --config is specified or exama.yaml exists
     exama_config_path = getattr(args, 'config', None)
+    cache_dir = DEFAULT_SHEET_CACHE_DIR if args.cache else None
 
     if exama_config_path or DEFAULT_EXAMA_CONFIG.exists():
         collection = fetch_recruited_with_config(
             config_path=exama_config_path or DEFAULT_EXAMA_CONFIG,
             funded_only=args.funded_only if not getattr(args, 'all_funding', False) else False,
             active_only=args.active_only,
+            cache_dir=cache_dir,
+            cache_ttl=args.cache_ttl,
+            force_refresh=args.refresh,
         )
     else:
         collection = fetch_recruited(
@@ -113,6 +118,9 @@ def harvest_team(args: argparse.Namespace) -> int:
             sheet_name=args.sheet_name,
             funded_only=args.funded_only,
             active_only=args.active_only,
+            cache_dir=cache_dir,
+            cache_ttl=args.cache_ttl,
+            force_refresh=args.refresh,
         )
 
     personnel = collection.unique_personnel()
@@ -571,6 +579,22 @@ Legacy individual commands (deprecated, use subcommands above):
         action="store_true",
         help="Only include currently active personnel",
     )
+    team_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the downloaded sheet in ~/.cache/exa-ma/team",
+    )
+    team_parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=3600,
+        help="Cache TTL in seconds (default: 3600)",
+    )
+    team_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Force refresh, ignoring cache",
+    )
     team_parser.add_argument(
         "--pages-dir",
         help="Directory for individual person pages (generates xref links)",
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +28,24 @@ from pydantic import BaseModel, Field
 # Default config file name
 DEFAULT_CONFIG_FILE = "exama.yaml"
 
+# libyaml's parser when available, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: Path, mtime_ns: int) -> Any:
+    """Parse a YAML file; the mtime in the cache key drops stale entries."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file, reusing the parse while the file is unchanged.
+
+    The returned data is shared between callers and must not be modified.
+    """
+    return _parse_yaml(path, path.stat().st_mtime_ns)
+
 
 class ProjectConfig(BaseModel):
     """Project-level configuration."""
@@ -160,8 +179,7 @@ class NewsConfig(BaseModel):
         if not file_path.exists():
             return self.events
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml(file_path) or {}
 
         events_data = data.get("events", [])
         return [NewsEvent.model_validate(e) for e in events_data]
@@ -212,8 +230,7 @@ class ExaMAConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml(path) or {}
 
         config = cls.model_validate(data)
         config._config_path = path
@@ -339,8 +356,7 @@ def merge_with_legacy_deliverables(
     if not legacy_path.exists():
         return config
 
-    with open(legacy_path, "r", encoding="utf-8") as f:
-        legacy_data = yaml.safe_load(f) or {}
+    legacy_data = _load_yaml(legacy_path) or {}
 
     # Convert legacy format to new format
     settings_data = legacy_data.get("settings", {})
@@ -379,8 +395,7 @@ def merge_with_legacy_news(
     if not legacy_path.exists():
         return config
 
-    with open(legacy_path, "r", encoding="utf-8") as f:
-        legacy_data = yaml.safe_load(f) or {}
+    legacy_data = _load_yaml(legacy_path) or {}
 
     # Convert legacy format to new format
     events_data = legacy_data.get("events", [])
@@ -133,7 +133,7 @@ def cmd_list(args: argparse.Namespace) -> int:
     if args.wp:
         packages = [
             p for p in packages
-            if any(wp.wp_number == args.wp for wp in p.work_packages)
+            if args.wp in p.wp_numbers
         ]
 
     # Output format
@@ -352,12 +352,15 @@ def cmd_generate(args: argparse.Namespace) -> int:
 
         # Fetch data
         print("Fetching data...")
-        frameworks = fetcher.fetch()
-        print(f"  Frameworks: {len(frameworks.packages)}")
-
         applications = None
-        if hasattr(fetcher, 'fetch_applications'):
-            applications = fetcher.fetch_applications()
+        if isinstance(fetcher, ExcelFetcher):
+            frameworks, applications = fetcher.fetch_all(max_workers=args.workers)
+        else:
+            frameworks = fetcher.fetch()
+            if hasattr(fetcher, 'fetch_applications'):
+                applications = fetcher.fetch_applications()
+        print(f"  Frameworks: {len(frameworks.packages)}")
+        if applications is not None:
             print(f"  Applications: {len(applications.applications)}")
 
     except Exception as e:
@@ -401,7 +404,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
         # Filter frameworks
         filtered_pkgs = [
             p for p in frameworks.packages
-            if any(wp.wp_number == wp_num for wp in p.work_packages)
+            if wp_num in p.wp_numbers
         ]
         frameworks = SoftwareCollection(
             packages=filtered_pkgs,
@@ -770,6 +773,12 @@ Examples:
         "-c", "--config",
         help="YAML config file for controlling which items to include",
     )
+    gen_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing Excel sheets (default: 1, in-process)",
+    )
 
     # Init-config command
     init_config_parser = subparsers.add_parser(
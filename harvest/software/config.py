@@ -134,6 +134,16 @@ class GenerationConfig:
 
         return config
 
+    @property
+    def frameworks_sorted(self) -> tuple[FrameworkConfig, ...]:
+        """Framework configs ordered by priority (highest first)."""
+        return tuple(sorted(self.frameworks.values(), key=lambda f: -f.priority))
+
+    @property
+    def applications_sorted(self) -> tuple[ApplicationConfig, ...]:
+        """Application configs ordered by priority (highest first)."""
+        return tuple(sorted(self.applications.values(), key=lambda a: -a.priority))
+
     def is_framework_enabled(self, slug: str) -> bool:
         """Check if a framework should be included."""
         # Check explicit include_only list
@@ -11,11 +11,14 @@ from __future__ import annotations
 
 import io
 import math
+import sys
 import urllib.request
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .models import (
     Application,
@@ -27,6 +30,7 @@ from .models import (
     SoftwareCollection,
     SoftwarePackage,
     WorkPackageInfo,
+    _split_csv,
 )
 
 # Import unified config (conditional to avoid circular imports)
@@ -64,10 +68,53 @@ def parse_bool(value: Any) -> bool:
         return False
     if isinstance(value, bool):
         return value
+    if isinstance(value, (int, float)):
+        # pandas reads integer columns with gaps as floats (1.0)
+        return value == 1
     str_val = str(value).lower().strip()
     return str_val in ("true", "yes", "1", "x", "available")
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(text: str) -> datetime | None:
+    """Parse an ISO 8601 string, memoized as sheets repeat the same dates."""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_datetime(value: Any, date_only: bool = False) -> datetime | None:
+    """Parse a datetime cell value.
+
+    Date-formatted cells already arrive as datetime objects from the Excel
+    reader, so only string cells go through (cached) ISO parsing.
+
+    Args:
+        value: Raw cell value
+        date_only: Ignore anything after the first whitespace (time part)
+    """
+    if isinstance(value, datetime):
+        # pandas NaT is a datetime subclass that never equals itself
+        return value if value == value else None
+    if is_nan(value):
+        return None
+    text = str(value).strip()
+    if date_only:
+        text = text.split()[0]
+    return _parse_iso_datetime(text)
+
+
+def _intern_keys(mapping: dict[str, str]) -> dict[str, str]:
+    """Intern column-map strings so per-row header lookups compare by identity."""
+    return {sys.intern(k): sys.intern(v) for k, v in mapping.items()}
+
+
+def _intern_header(header: Any) -> Any:
+    """Intern a sheet header cell so it matches the interned column-map keys."""
+    return sys.intern(header) if isinstance(header, str) else header
+
+
 class SoftwareDataSource(ABC):
     """Abstract base class for software data sources."""
 
@@ -86,7 +133,7 @@ class ExcelFetcher(SoftwareDataSource):
     """Fetch software and application data from Excel files."""
 
     # Column mappings from Excel to model fields (Software/Frameworks sheet)
-    COLUMN_MAP = {
+    COLUMN_MAP = _intern_keys({
         "Name": "name",
         "Description": "description",
         "Partner": "partner",
@@ -110,9 +157,9 @@ class ExcelFetcher(SoftwareDataSource):
         "Metadata": "metadata_info",
         "Benchmarked": "benchmark_status",
         "Comments": "comments",
-    }
+    })
 
-    PACKAGING_COLUMN_MAP = {
+    PACKAGING_COLUMN_MAP = _intern_keys({
         "Software Name": "software_name",
         "Version": "version",
         "Spack Available": "spack_available",
@@ -132,10 +179,10 @@ class ExcelFetcher(SoftwareDataSource):
         "Apptainer Info Source": "apptainer_url",
         "Notes": "notes",
         "Last Updated": "last_updated",
-    }
+    })
 
     # Column mappings for Applications sheet
-    APPLICATION_COLUMN_MAP = {
+    APPLICATION_COLUMN_MAP = _intern_keys({
         "id": "id",
         "name": "name",
         "Partners": "partners",
@@ -164,7 +211,7 @@ class ExcelFetcher(SoftwareDataSource):
         "repo_url": "repo_url",
         "tex_url": "tex_url",
         "notes": "notes",
-    }
+    })
 
     def __init__(
         self,
@@ -189,24 +236,44 @@ class ExcelFetcher(SoftwareDataSource):
         if self.file_path and not self.file_path.exists():
             raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
-    def _load_dataframe(self, sheet_name: str):
-        """Load a sheet as a pandas DataFrame."""
+    def _iter_rows(self, sheet_name: str) -> Iterator[dict[str, Any]]:
+        """Stream a sheet as dicts keyed by the header row.
+
+        Uses openpyxl in read-only mode so rows are yielded as plain tuples
+        without building an intermediate DataFrame.
+        """
         try:
-            import pandas as pd
+            import openpyxl
         except ImportError:
             raise ImportError(
-                "pandas is required for Excel support. "
-                "Install with: pip install pandas openpyxl"
+                "openpyxl is required for Excel support. "
+                "Install with: pip install openpyxl"
             )
 
-        return pd.read_excel(self.file_path, sheet_name=sheet_name)
-
-    def _parse_software_row(self, row: dict, packaging: dict[str, PackagingInfo]) -> SoftwarePackage:
+        wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = wb[sheet_name].iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                return
+            # For repeated headers the first column wins, as with pandas
+            index: dict[Any, int] = {}
+            for i, header in enumerate(headers):
+                index.setdefault(_intern_header(header), i)
+            fields = tuple(index.items())
+            for values in rows:
+                n = len(values)
+                yield {name: values[i] if i < n else None for name, i in fields}
+        finally:
+            wb.close()
+
+    @classmethod
+    def _parse_software_row(cls, row: dict, packaging: dict[str, PackagingInfo]) -> SoftwarePackage:
         """Parse a single row into a SoftwarePackage."""
         # Build kwargs from column mapping
         kwargs: dict[str, Any] = {}
 
-        for excel_col, model_field in self.COLUMN_MAP.items():
+        for excel_col, model_field in cls.COLUMN_MAP.items():
             value = row.get(excel_col)
 
             if model_field == "benchmark_status":
@@ -215,8 +282,7 @@ class ExcelFetcher(SoftwareDataSource):
                 kwargs[model_field] = parse_bool(value)
             elif model_field in ("emails", "languages", "parallelism", "data_formats",
                                   "devops", "channels", "bottlenecks"):
-                # These are handled by the validator in the model
-                kwargs[model_field] = value
+                kwargs[model_field] = _split_csv(value)
             else:
                 kwargs[model_field] = clean_string(value)
 
@@ -233,9 +299,10 @@ class ExcelFetcher(SoftwareDataSource):
         if name and name in packaging:
             kwargs["packaging"] = packaging[name]
 
-        return SoftwarePackage(**kwargs)
+        return SoftwarePackage.from_row(kwargs, trusted=True)
 
-    def _parse_packaging_row(self, row: dict) -> PackagingInfo | None:
+    @classmethod
+    def _parse_packaging_row(cls, row: dict) -> PackagingInfo | None:
         """Parse a packaging row into PackagingInfo."""
         software_name = clean_string(row.get("Software Name"))
         if not software_name:
@@ -243,7 +310,7 @@ class ExcelFetcher(SoftwareDataSource):
 
         kwargs: dict[str, Any] = {"software_name": software_name}
 
-        for excel_col, model_field in self.PACKAGING_COLUMN_MAP.items():
+        for excel_col, model_field in cls.PACKAGING_COLUMN_MAP.items():
             if model_field == "software_name":
                 continue
 
@@ -252,42 +319,28 @@ class ExcelFetcher(SoftwareDataSource):
             if model_field.endswith("_available"):
                 kwargs[model_field] = parse_bool(value)
             elif model_field == "last_updated":
-                if not is_nan(value):
-                    if isinstance(value, datetime):
-                        kwargs[model_field] = value
-                    else:
-                        try:
-                            kwargs[model_field] = datetime.fromisoformat(str(value))
-                        except (ValueError, TypeError):
-                            pass
+                kwargs[model_field] = parse_datetime(value)
             else:
                 kwargs[model_field] = clean_string(value)
 
-        return PackagingInfo(**kwargs)
+        return PackagingInfo.from_row(kwargs, trusted=True)
 
     def fetch_packaging(self) -> dict[str, PackagingInfo]:
         """Fetch all packaging info, keyed by software name."""
-        df = self._load_dataframe(self.packaging_sheet)
         packaging = {}
 
-        for _, row in df.iterrows():
-            info = self._parse_packaging_row(row.to_dict())
+        for row in self._iter_rows(self.packaging_sheet):
+            info = self._parse_packaging_row(row)
             if info:
                 packaging[info.software_name] = info
 
         return packaging
 
-    def fetch(self) -> SoftwareCollection:
-        """Fetch all software data."""
-        # First fetch packaging info
-        packaging = self.fetch_packaging()
-
-        # Then fetch software data
-        df = self._load_dataframe(self.software_sheet)
+    def _parse_software_rows(self, packaging: dict[str, PackagingInfo]) -> list[SoftwarePackage]:
+        """Parse every named row of the software sheet."""
         packages = []
 
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
+        for row_dict in self._iter_rows(self.software_sheet):
             name = clean_string(row_dict.get("Name"))
             if not name:
                 continue
@@ -299,17 +352,26 @@ class ExcelFetcher(SoftwareDataSource):
                 print(f"Warning: Failed to parse software '{name}': {e}")
                 continue
 
+        return packages
+
+    def fetch(self) -> SoftwareCollection:
+        """Fetch all software data."""
+        # First fetch packaging info, then software data
+        packaging = self.fetch_packaging()
+        packages = self._parse_software_rows(packaging)
+
         return SoftwareCollection(
             packages=packages,
             source_file=str(self.file_path) if self.file_path else "unknown",
             fetched_at=datetime.now(),
         )
 
-    def _parse_application_row(self, row: dict) -> Application:
+    @classmethod
+    def _parse_application_row(cls, row: dict) -> Application:
         """Parse a single row into an Application."""
         kwargs: dict[str, Any] = {}
 
-        for excel_col, model_field in self.APPLICATION_COLUMN_MAP.items():
+        for excel_col, model_field in cls.APPLICATION_COLUMN_MAP.items():
             value = row.get(excel_col)
 
             if model_field == "application_type":
@@ -317,14 +379,7 @@ class ExcelFetcher(SoftwareDataSource):
             elif model_field == "status":
                 kwargs[model_field] = ApplicationStatus.from_string(clean_string(value))
             elif model_field in ("spec_due", "proto_due"):
-                if not is_nan(value):
-                    if isinstance(value, datetime):
-                        kwargs[model_field] = value
-                    else:
-                        try:
-                            kwargs[model_field] = datetime.fromisoformat(str(value).split()[0])
-                        except (ValueError, TypeError):
-                            pass
+                kwargs[model_field] = parse_datetime(value, date_only=True)
             elif model_field in (
                 "partners", "pc", "responsible", "work_packages",
                 "methods_wp1", "methods_wp2", "methods_wp3", "methods_wp4",
@@ -332,23 +387,18 @@ class ExcelFetcher(SoftwareDataSource):
                 "inputs", "outputs", "metrics", "benchmark_scope",
                 "frameworks", "parallel_frameworks"
             ):
-                # These are handled by the validator in the model
-                kwargs[model_field] = value
+                kwargs[model_field] = _split_csv(value)
             else:
                 kwargs[model_field] = clean_string(value)
 
-        return Application(**kwargs)
+        # Rows without a name still go through validation so they are rejected
+        return Application.from_row(kwargs, trusted=kwargs["name"] is not None)
 
-    def fetch_applications(self) -> ApplicationCollection:
-        """Fetch all application data."""
-        if not self.file_path:
-            raise ValueError("file_path is required for Excel fetching")
-
-        df = self._load_dataframe(self.applications_sheet)
+    def _parse_application_rows(self) -> list[Application]:
+        """Parse every row of the applications sheet that has an id."""
         applications = []
 
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
+        for row_dict in self._iter_rows(self.applications_sheet):
             app_id = clean_string(row_dict.get("id"))
             if not app_id:
                 continue
@@ -360,12 +410,94 @@ class ExcelFetcher(SoftwareDataSource):
                 print(f"Warning: Failed to parse application '{app_id}': {e}")
                 continue
 
+        return applications
+
+    def fetch_applications(self) -> ApplicationCollection:
+        """Fetch all application data."""
+        if not self.file_path:
+            raise ValueError("file_path is required for Excel fetching")
+
         return ApplicationCollection(
-            applications=applications,
+            applications=self._parse_application_rows(),
             source_file=str(self.file_path),
             fetched_at=datetime.now(),
         )
 
+    def fetch_all(self, max_workers: int = 3) -> tuple[SoftwareCollection, ApplicationCollection]:
+        """Fetch software and application data, parsing sheets in parallel.
+
+        The frameworks, packaging and applications sheets are parsed in
+        separate worker processes; packaging info is linked to the software
+        packages afterwards in this process.
+
+        Args:
+            max_workers: Number of worker processes (1 or less parses the
+                sheets in this process, without starting a pool)
+
+        Returns:
+            Tuple of (software collection, application collection)
+        """
+        if not self.file_path:
+            raise ValueError("file_path is required for Excel fetching")
+
+        path = str(self.file_path)
+        jobs = {
+            "frameworks": self.software_sheet,
+            "packaging": self.packaging_sheet,
+            "applications": self.applications_sheet,
+        }
+
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    kind: executor.submit(_parse_sheet, path, sheet, kind)
+                    for kind, sheet in jobs.items()
+                }
+                results = {kind: future.result() for kind, future in futures.items()}
+        else:
+            results = {kind: _parse_sheet(path, sheet, kind) for kind, sheet in jobs.items()}
+
+        packaging = {info.software_name: info for info in results["packaging"]}
+        packages = [
+            pkg.model_copy(update={"packaging": packaging[pkg.name]})
+            if pkg.name in packaging else pkg
+            for pkg in results["frameworks"]
+        ]
+        fetched_at = datetime.now()
+
+        return (
+            SoftwareCollection(packages=packages, source_file=path, fetched_at=fetched_at),
+            ApplicationCollection(
+                applications=results["applications"],
+                source_file=path,
+                fetched_at=fetched_at,
+            ),
+        )
+
+
+def _parse_sheet(path: str, sheet_name: str, sheet_kind: str) -> list:
+    """Parse one sheet of an Excel file into a list of models.
+
+    Module-level so it can be pickled and run in a ProcessPoolExecutor
+    worker (including under the "spawn" start method).
+
+    Args:
+        path: Path to the Excel file
+        sheet_name: Name of the sheet to parse
+        sheet_kind: One of "frameworks", "packaging" or "applications"
+
+    Returns:
+        List of SoftwarePackage (without packaging linked), PackagingInfo
+        or Application objects
+    """
+    if sheet_kind == "frameworks":
+        return ExcelFetcher(path, software_sheet=sheet_name)._parse_software_rows({})
+    if sheet_kind == "packaging":
+        return list(ExcelFetcher(path, packaging_sheet=sheet_name).fetch_packaging().values())
+    if sheet_kind == "applications":
+        return ExcelFetcher(path, applications_sheet=sheet_name)._parse_application_rows()
+    raise ValueError(f"Unknown sheet kind: {sheet_kind}")
+
 
 class GoogleSheetsFetcher(SoftwareDataSource):
     """Fetch software and application data from Google Sheets.
@@ -399,6 +531,7 @@ class GoogleSheetsFetcher(SoftwareDataSource):
         self.packaging_sheet = packaging_sheet
         self.applications_sheet = applications_sheet
         self._excel_data: bytes | None = None
+        self._workbook = None  # pandas ExcelFile built from _excel_data
 
     def _fetch_excel(self) -> bytes:
         """Fetch the spreadsheet as XLSX bytes."""
@@ -413,6 +546,7 @@ class GoogleSheetsFetcher(SoftwareDataSource):
         try:
             response = urllib.request.urlopen(url)
             self._excel_data = response.read()
+            self._workbook = None
             return self._excel_data
         except Exception as e:
             raise RuntimeError(
@@ -420,26 +554,31 @@ class GoogleSheetsFetcher(SoftwareDataSource):
                 f"Ensure the sheet is publicly accessible. Error: {e}"
             )
 
-    def _load_sheet(self, sheet_name: str):
-        """Load a specific sheet as pandas DataFrame."""
+    def _get_workbook(self):
+        """Get the downloaded spreadsheet as a shared pandas ExcelFile.
+
+        The XLSX archive is unpacked once and reused for every sheet.
+        """
+        if self._workbook is not None:
+            return self._workbook
+
         try:
             import pandas as pd
         except ImportError:
             raise ImportError("pandas is required. Install with: pip install pandas")
 
-        data = self._fetch_excel()
-        return pd.read_excel(io.BytesIO(data), sheet_name=sheet_name)
+        self._workbook = pd.ExcelFile(io.BytesIO(self._fetch_excel()), engine="openpyxl")
+        return self._workbook
+
+    def _load_sheet(self, sheet_name: str):
+        """Load a specific sheet as pandas DataFrame."""
+        df = self._get_workbook().parse(sheet_name)
+        df.columns = [_intern_header(c) for c in df.columns]
+        return df
 
     def get_sheet_names(self) -> list[str]:
         """Get list of available sheet names."""
-        try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("pandas is required. Install with: pip install pandas")
-
-        data = self._fetch_excel()
-        xl = pd.ExcelFile(io.BytesIO(data))
-        return xl.sheet_names
+        return self._get_workbook().sheet_names
 
     def fetch_packaging(self) -> dict[str, PackagingInfo]:
         """Fetch packaging info from Google Sheets."""
@@ -448,11 +587,10 @@ class GoogleSheetsFetcher(SoftwareDataSource):
         except Exception:
             return {}
 
-        excel_fetcher = ExcelFetcher()
         packaging = {}
 
-        for _, row in df.iterrows():
-            info = excel_fetcher._parse_packaging_row(row.to_dict())
+        for row in df.to_dict(orient="records"):
+            info = ExcelFetcher._parse_packaging_row(row)
             if info:
                 packaging[info.software_name] = info
 
@@ -463,17 +601,15 @@ class GoogleSheetsFetcher(SoftwareDataSource):
         packaging = self.fetch_packaging()
         df = self._load_sheet(self.software_sheet)
 
-        excel_fetcher = ExcelFetcher()
         packages = []
 
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
+        for row_dict in df.to_dict(orient="records"):
             name = clean_string(row_dict.get("Name"))
             if not name:
                 continue
 
             try:
-                package = excel_fetcher._parse_software_row(row_dict, packaging)
+                package = ExcelFetcher._parse_software_row(row_dict, packaging)
                 packages.append(package)
             except Exception as e:
                 print(f"Warning: Failed to parse software '{name}': {e}")
@@ -489,17 +625,15 @@ class GoogleSheetsFetcher(SoftwareDataSource):
         """Fetch applications from Google Sheets."""
         df = self._load_sheet(self.applications_sheet)
 
-        excel_fetcher = ExcelFetcher()
         applications = []
 
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
+        for row_dict in df.to_dict(orient="records"):
             app_id = clean_string(row_dict.get("id"))
             if not app_id:
                 continue
 
             try:
-                app = excel_fetcher._parse_application_row(row_dict)
+                app = ExcelFetcher._parse_application_row(row_dict)
                 applications.append(app)
             except Exception as e:
                 print(f"Warning: Failed to parse application '{app_id}': {e}")
@@ -7,11 +7,112 @@ Excel/Google Sheets source and provide validation and type safety.
 
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Any, Optional, TypeVar
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+# License substrings identifying FLOSS (FSF/OSI conformant) licenses, lowercased
+_FLOSS_KEYWORDS = ("gpl", "lgpl", "mit", "bsd", "apache", "mpl", "cecill")
+
+# Separators for multi-valued spreadsheet cells
+_SPLIT_RE = re.compile(r"[,\n]")
+
+# SoftwarePackage fields parsed from comma/newline separated cells
+_SOFTWARE_LIST_FIELDS = frozenset({
+    "emails", "languages", "parallelism", "data_formats", "devops", "channels", "bottlenecks",
+})
+
+# Application fields parsed from comma/newline separated cells
+_APPLICATION_LIST_FIELDS = frozenset({
+    "partners", "pc", "responsible", "work_packages",
+    "methods_wp1", "methods_wp2", "methods_wp3", "methods_wp4",
+    "methods_wp5", "methods_wp6", "wp7_topics",
+    "inputs", "outputs", "metrics", "benchmark_scope",
+    "frameworks", "parallel_frameworks",
+})
+
+# Slug character substitutions (applications keep dashes)
+_SLUG_TABLE = str.maketrans({"/": "_", "+": "p", " ": "_", "-": "_"})
+_APP_SLUG_TABLE = str.maketrans({"/": "_", "+": "p", " ": "_"})
+
+
+def _split_csv(v: Any) -> list:
+    """Split a comma/newline separated cell into a list of stripped tokens."""
+    if v is None or (isinstance(v, float) and v != v):  # NaN
+        return []
+    if isinstance(v, list):
+        return v
+    s = v if isinstance(v, str) else str(v)
+    return [t for t in map(str.strip, _SPLIT_RE.split(s)) if t]
+
+
+def _split_list_fields(data: Any, fields: frozenset[str]) -> Any:
+    """Return a copy of a raw row dict with its list-valued fields split."""
+    if not isinstance(data, dict):
+        return data
+    keys = fields & data.keys()
+    if not keys:
+        return data
+    data = dict(data)
+    for k in keys:
+        data[k] = _split_csv(data[k])
+    return data
+
+
+def _parse_iso_datetime(v: Any) -> Any:
+    """Parse ISO-8601 strings with ``datetime.fromisoformat``.
+
+    Anything else (or a string it rejects) is returned unchanged for
+    pydantic's own, more lenient, datetime coercion.
+    """
+    if isinstance(v, str):
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            return v
+    return v
+
+
+@lru_cache(maxsize=1024)
+def _slugify(name: str, keep_dashes: bool = False) -> str:
+    """Generate a URL-safe slug, memoized as pages look up the same names repeatedly."""
+    return name.lower().translate(_APP_SLUG_TABLE if keep_dashes else _SLUG_TABLE)
+
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+_SheetModelT = TypeVar("_SheetModelT", bound="_SheetModel")
+
+
+class _SheetModel(BaseModel):
+    """Base for models built from spreadsheet rows."""
+
+    @classmethod
+    def from_row(
+        cls: type[_SheetModelT], data: dict[str, Any], trusted: bool = False
+    ) -> _SheetModelT:
+        """Create an instance from a parsed row.
+
+        Args:
+            data: Field values keyed by model field name
+            trusted: Skip validation with ``model_construct``. Field
+                validators do not run on this path, so values must already
+                have their final types (e.g. list fields already split).
+        """
+        if trusted:
+            return cls.model_construct(**data)
+        return cls.model_validate(data)
 
 
 class BenchmarkStatus(str, Enum):
@@ -26,19 +127,29 @@ class BenchmarkStatus(str, Enum):
     @classmethod
     def from_string(cls, value: str | None) -> BenchmarkStatus | None:
         """Parse benchmark status from Excel string."""
-        if not value or str(value).strip().upper() == "NOT YET":
+        if not value:
             return cls.NOT_YET
         value_lower = str(value).lower()
-        if "cpu" in value_lower and "gpu" in value_lower:
-            return cls.CPU_OR_GPU
-        if "cpu" in value_lower:
-            return cls.CPU_ONLY
-        if "gpu" in value_lower:
-            return cls.GPU_ONLY
-        return cls.NOT_YET
+        status = _BM_MAP.get(value_lower.strip())
+        if status is not None:
+            return status
+        return _BM_TABLE[(("cpu" in value_lower) << 1) | ("gpu" in value_lower)]
+
+
+# Exact (lowercased) spellings, checked before the substring rules
+_BM_MAP = {m.value: m for m in BenchmarkStatus}
+_BM_MAP["not yet"] = BenchmarkStatus.NOT_YET
+
+# Substring fallback indexed by (has "cpu" << 1) | has "gpu"
+_BM_TABLE = (
+    BenchmarkStatus.NOT_YET,
+    BenchmarkStatus.GPU_ONLY,
+    BenchmarkStatus.CPU_ONLY,
+    BenchmarkStatus.CPU_OR_GPU,
+)
 
 
-class PackagingInfo(BaseModel):
+class PackagingInfo(_SheetModel):
     """Packaging information for a software package."""
 
     software_name: str
@@ -72,18 +183,20 @@ class PackagingInfo(BaseModel):
     notes: Optional[str] = None
     last_updated: Optional[datetime] = None
 
+    _parse_last_updated = field_validator("last_updated", mode="before")(_parse_iso_datetime)
+
     @property
     def has_any_package(self) -> bool:
         """Check if any packaging is available."""
-        return any([
-            self.spack_available,
-            self.guix_available,
-            self.petsc_available,
-            self.docker_available,
-            self.apptainer_available,
-        ])
+        return (
+            self.spack_available
+            or self.guix_available
+            or self.petsc_available
+            or self.docker_available
+            or self.apptainer_available
+        )
 
-    @property
+    @cached_property
     def community_packages(self) -> list[str]:
         """List of available community package managers."""
         packages = []
@@ -94,39 +207,54 @@ class PackagingInfo(BaseModel):
         return packages
 
 
-class WorkPackageInfo(BaseModel):
-    """Work package involvement for a software."""
+@dataclass(slots=True)
+class WorkPackageInfo:
+    """Work package involvement for a software.
 
-    wp_number: int = Field(ge=1, le=7)
-    topics: list[str] = Field(default_factory=list)
+    A plain slotted dataclass rather than a pydantic model: it is created
+    for every WP column of every row and only needs the range check below.
+    """
+
+    wp_number: int
+    topics: list[str] = field(default_factory=list)
     benchmarked: bool = False
 
+    def __post_init__(self) -> None:
+        if not 1 <= self.wp_number <= 7:
+            raise ValueError(f"wp_number must be between 1 and 7, got {self.wp_number}")
+
     @classmethod
     def from_excel_row(
         cls, row: dict, wp_num: int
     ) -> WorkPackageInfo | None:
         """Create from Excel row data."""
+        from .fetcher import parse_bool  # fetcher imports this module
+
         wp_key = f"WP{wp_num}"
         topics_raw = row.get(wp_key)
-        benchmarked_raw = row.get(f"{wp_key} Benchmarked", False)
+        benchmarked_raw = row.get(f"{wp_key} Benchmarked")
 
-        if not topics_raw or (isinstance(topics_raw, float) and str(topics_raw) == "nan"):
+        if not topics_raw or (isinstance(topics_raw, float) and topics_raw != topics_raw):  # NaN
             return None
 
-        topics = [t.strip() for t in str(topics_raw).split(",") if t.strip()]
+        text = topics_raw if isinstance(topics_raw, str) else str(topics_raw)
+        topics = [t for t in map(str.strip, text.split(",")) if t]
         if not topics:
             return None
 
-        return cls(
-            wp_number=wp_num,
-            topics=topics,
-            benchmarked=bool(benchmarked_raw),
-        )
+        return cls(wp_number=wp_num, topics=topics, benchmarked=parse_bool(benchmarked_raw))
 
 
-class SoftwarePackage(BaseModel):
+class SoftwarePackage(_SheetModel):
     """Complete software package metadata."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        str_strip_whitespace=True,
+    )
+
     # Identity
     name: str
     description: Optional[str] = None
@@ -168,76 +296,85 @@ class SoftwarePackage(BaseModel):
     # Packaging (linked separately)
     packaging: Optional[PackagingInfo] = None
 
-    @field_validator("emails", "languages", "parallelism", "data_formats", "devops", "channels", "bottlenecks", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def split_comma_separated(cls, v):
-        """Split comma/newline separated strings into lists."""
-        if v is None or (isinstance(v, float) and str(v) == "nan"):
-            return []
-        if isinstance(v, list):
-            return v
-        return [item.strip() for item in str(v).replace("\n", ",").split(",") if item.strip()]
+    def _split_lists(cls, data: Any) -> Any:
+        """Split comma/newline separated list fields in one pass over the row."""
+        return _split_list_fields(data, _SOFTWARE_LIST_FIELDS)
 
     @property
     def slug(self) -> str:
         """Generate URL-safe slug from name."""
-        return (
-            self.name.lower()
-            .replace("/", "_")
-            .replace("+", "p")
-            .replace(" ", "_")
-            .replace("-", "_")
-        )
+        return _slugify(self.name)
+
+    @cached_property
+    def wp_numbers(self) -> frozenset[int]:
+        """Work package numbers this package is involved in."""
+        return frozenset(wp.wp_number for wp in self.work_packages)
+
+    @cached_property
+    def _repo_lower(self) -> str:
+        """Stripped, lowercased repository URL (empty if unset)."""
+        return (self.repository or "").strip().lower()
 
     @property
     def has_public_repository(self) -> bool:
         """Check if a public repository is available."""
-        return bool(self.repository and self.repository.strip())
+        return bool(self._repo_lower)
 
     @property
     def supports_pull_requests(self) -> bool:
         """Check if repository supports PRs (GitHub/GitLab)."""
-        if not self.repository:
-            return False
-        repo_lower = self.repository.lower()
+        repo_lower = self._repo_lower
         return "github.com" in repo_lower or "gitlab" in repo_lower
 
     @property
     def has_floss_license(self) -> bool:
         """Check if license is FLOSS (FSF/OSI conformant)."""
-        if not self.license:
+        lic = self.license
+        if not lic:
             return False
-        floss_keywords = ["GPL", "LGPL", "MIT", "BSD", "Apache", "MPL", "CECILL"]
-        return any(kw.lower() in self.license.lower() for kw in floss_keywords)
+        lic_lower = lic.lower()
+        return any(kw in lic_lower for kw in _FLOSS_KEYWORDS)
+
+    @cached_property
+    def _devops_lower(self) -> frozenset[str]:
+        """Lowercased devops entries.
+
+        Computed lazily rather than in a model validator so instances
+        built with ``model_construct`` get it too.
+        """
+        return frozenset(d.lower() for d in self.devops)
 
     @property
     def has_ci(self) -> bool:
         """Check if CI is configured."""
-        return "Continuous Integration" in self.devops
+        return "continuous integration" in self._devops_lower
 
     @property
     def has_unit_tests(self) -> bool:
         """Check if unit tests exist."""
-        return any("unit" in d.lower() for d in self.devops)
+        return any("unit" in d for d in self._devops_lower)
 
     @property
     def has_benchmarking(self) -> bool:
         """Check if benchmarking is configured."""
-        return any("benchmark" in d.lower() for d in self.devops)
+        return any("benchmark" in d for d in self._devops_lower)
 
     @property
     def has_packages(self) -> bool:
         """Check if packages exist."""
-        return any("package" in d.lower() for d in self.devops)
+        return any("package" in d for d in self._devops_lower)
 
     @property
     def is_eligible_for_page(self) -> bool:
         """Check if software meets criteria for page generation."""
+        # Cheapest / most often false checks first
         return (
-            self.benchmark_status is not None
-            and self.benchmark_status != BenchmarkStatus.NOT_YET
+            bool(self.devops)
             and bool(self.license)
-            and bool(self.devops)
+            and self.benchmark_status is not None
+            and self.benchmark_status is not BenchmarkStatus.NOT_YET
         )
 
     def get_license_list(self) -> list[str]:
@@ -262,25 +399,40 @@ class SoftwareCollection(BaseModel):
     source_file: Optional[str] = None
     fetched_at: Optional[datetime] = None
 
+    _parse_fetched_at = field_validator("fetched_at", mode="before")(_parse_iso_datetime)
+
     @property
     def eligible_packages(self) -> list[SoftwarePackage]:
         """Get packages eligible for page generation."""
         return [p for p in self.packages if p.is_eligible_for_page]
 
+    @cached_property
+    def _name_index(self) -> dict[str, SoftwarePackage]:
+        """Packages by lowercased name (first one wins), built on first lookup.
+
+        Packages are not mutated after fetching.
+        """
+        index: dict[str, SoftwarePackage] = {}
+        for pkg in self.packages:
+            index.setdefault(pkg.name.lower(), pkg)
+        return index
+
     def get_by_name(self, name: str) -> SoftwarePackage | None:
         """Find package by name (case-insensitive)."""
-        name_lower = name.lower()
+        return self._name_index.get(name.lower())
+
+    @cached_property
+    def _wp_index(self) -> dict[int, list[SoftwarePackage]]:
+        """Packages by work package number, built on first lookup."""
+        index: dict[int, list[SoftwarePackage]] = {}
         for pkg in self.packages:
-            if pkg.name.lower() == name_lower:
-                return pkg
-        return None
+            for wp_number in pkg.wp_numbers:
+                index.setdefault(wp_number, []).append(pkg)
+        return index
 
     def get_by_work_package(self, wp_num: int) -> list[SoftwarePackage]:
         """Get packages involved in a specific work package."""
-        return [
-            p for p in self.packages
-            if any(wp.wp_number == wp_num for wp in p.work_packages)
-        ]
+        return list(self._wp_index.get(wp_num, ()))
 
 
 class ApplicationStatus(str, Enum):
@@ -297,10 +449,10 @@ class ApplicationStatus(str, Enum):
         if not value:
             return cls.PLANNED
         value_lower = str(value).lower().strip().replace("_", "-")
-        for status in cls:
-            if status.value == value_lower:
-                return status
-        return cls.PLANNED
+        return _APP_STATUS_MAP.get(value_lower, cls.PLANNED)
+
+
+_APP_STATUS_MAP = {m.value: m for m in ApplicationStatus}
 
 
 class ApplicationType(str, Enum):
@@ -318,24 +470,35 @@ class ApplicationType(str, Enum):
         if not value:
             return cls.MINI_APP
         value_lower = str(value).lower().strip().replace("_", "-")
-        for app_type in cls:
-            if app_type.value == value_lower:
-                return app_type
+        app_type = _APP_TYPE_MAP.get(value_lower)
+        if app_type is not None:
+            return app_type
         # Fallback matching
-        if "extended" in value_lower:
-            return cls.EXTENDED_MINI_APP
-        if "proxy" in value_lower:
-            return cls.PROXY_APP
-        if "full" in value_lower:
-            return cls.FULL_APPLICATION
-        if "demo" in value_lower:
-            return cls.DEMONSTRATOR
+        for keyword, app_type in _APP_TYPE_FALLBACK:
+            if keyword in value_lower:
+                return app_type
         return cls.MINI_APP
 
 
-class Application(BaseModel):
+_APP_TYPE_MAP = {m.value: m for m in ApplicationType}
+_APP_TYPE_FALLBACK = (
+    ("extended", ApplicationType.EXTENDED_MINI_APP),
+    ("proxy", ApplicationType.PROXY_APP),
+    ("full", ApplicationType.FULL_APPLICATION),
+    ("demo", ApplicationType.DEMONSTRATOR),
+)
+
+
+class Application(_SheetModel):
     """Application/benchmark metadata."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        str_strip_whitespace=True,
+    )
+
     # Identity
     id: str
     name: str
@@ -380,22 +543,15 @@ class Application(BaseModel):
     tex_url: Optional[str] = None
     notes: Optional[str] = None
 
-    @field_validator(
-        "partners", "pc", "responsible", "work_packages",
-        "methods_wp1", "methods_wp2", "methods_wp3", "methods_wp4",
-        "methods_wp5", "methods_wp6", "wp7_topics",
-        "inputs", "outputs", "metrics", "benchmark_scope",
-        "frameworks", "parallel_frameworks",
-        mode="before"
-    )
+    @model_validator(mode="before")
     @classmethod
-    def split_comma_separated(cls, v):
-        """Split comma/newline separated strings into lists."""
-        if v is None or (isinstance(v, float) and str(v) == "nan"):
-            return []
-        if isinstance(v, list):
-            return v
-        return [item.strip() for item in str(v).replace("\n", ",").split(",") if item.strip()]
+    def _split_lists(cls, data: Any) -> Any:
+        """Split comma/newline separated list fields in one pass over the row."""
+        return _split_list_fields(data, _APPLICATION_LIST_FIELDS)
+
+    _parse_due_dates = field_validator("spec_due", "proto_due", mode="before")(
+        _parse_iso_datetime
+    )
 
     @field_serializer("spec_due", "proto_due")
     def serialize_dates(self, value: datetime | None) -> str | None:
@@ -407,12 +563,7 @@ class Application(BaseModel):
     @property
     def slug(self) -> str:
         """Generate URL-safe slug from id."""
-        return (
-            self.id.lower()
-            .replace("/", "_")
-            .replace("+", "p")
-            .replace(" ", "_")
-        )
+        return _slugify(self.id, keep_dashes=True)
 
     @property
     def has_repository(self) -> bool:
@@ -431,15 +582,12 @@ class Application(BaseModel):
 
     @property
     def all_methods(self) -> list[str]:
-        """Get all methods across all work packages."""
-        methods = []
-        for wp_methods in [
+        """Get all methods across all work packages (deduplicated, in first-seen order)."""
+        return list(dict.fromkeys(chain(
             self.methods_wp1, self.methods_wp2, self.methods_wp3,
             self.methods_wp4, self.methods_wp5, self.methods_wp6,
-            self.wp7_topics
-        ]:
-            methods.extend(wp_methods)
-        return list(set(methods))
+            self.wp7_topics,
+        )))
 
 
 class ApplicationCollection(BaseModel):
@@ -449,6 +597,8 @@ class ApplicationCollection(BaseModel):
     source_file: Optional[str] = None
     fetched_at: Optional[datetime] = None
 
+    _parse_fetched_at = field_validator("fetched_at", mode="before")(_parse_iso_datetime)
+
     @property
     def benchmark_ready(self) -> list[Application]:
         """Get applications ready for benchmarking."""
@@ -459,25 +609,41 @@ class ApplicationCollection(BaseModel):
         """Get applications eligible for page generation."""
         return [a for a in self.applications if a.is_eligible_for_page]
 
+    @cached_property
+    def _id_index(self) -> dict[str, Application]:
+        """Applications by ID (first one wins), built on first lookup.
+
+        Applications are not mutated after fetching.
+        """
+        index: dict[str, Application] = {}
+        for app in self.applications:
+            index.setdefault(app.id, app)
+        return index
+
     def get_by_id(self, app_id: str) -> Application | None:
         """Find application by ID."""
-        for app in self.applications:
-            if app.id == app_id:
-                return app
-        return None
+        return self._id_index.get(app_id)
+
+    @cached_property
+    def _search_keys(self) -> list[tuple[Application, list[str], list[str]]]:
+        """(application, lowercased frameworks, uppercased work packages), computed once."""
+        return [
+            (a, [f.lower() for f in a.frameworks], [w.upper() for w in a.work_packages])
+            for a in self.applications
+        ]
 
     def get_by_framework(self, framework: str) -> list[Application]:
-        """Get applications using a specific framework."""
+        """Get applications using a specific framework (substring match)."""
         framework_lower = framework.lower()
         return [
-            a for a in self.applications
-            if any(framework_lower in f.lower() for f in a.frameworks)
+            a for a, frameworks, _ in self._search_keys
+            if any(framework_lower in f for f in frameworks)
         ]
 
     def get_by_work_package(self, wp: str) -> list[Application]:
-        """Get applications in a specific work package."""
+        """Get applications in a specific work package (substring match)."""
         wp_upper = wp.upper()
         return [
-            a for a in self.applications
-            if any(wp_upper in w.upper() for w in a.work_packages)
+            a for a, _, work_packages in self._search_keys
+            if any(wp_upper in w for w in work_packages)
         ]
@@ -11,14 +11,22 @@ Supports configuration from:
 
 from __future__ import annotations
 
+import hashlib
 import io
 import math
+import os
 import re
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +37,24 @@ try:
 except ImportError:
     HAS_UNIFIED_CONFIG = False
 
+# Precompiled patterns used per person / per row
+_WP_RE = re.compile(r"WP\s*(\d+)", re.IGNORECASE)
+# A whole work package label such as "WP3" or "WP 3"
+_WP_LABEL_RE = re.compile(r"WP\s*(\d+)\s*")
+_ADVISOR_SPLIT = re.compile(r"[,;\n]+")
+_SLUG_RE = re.compile(r"[^a-z0-9-]")
+
+# Per-WP involvement columns, WP0 (Project Office) through WP7
+_WP_LABELS = tuple(f"WP{wp_num}" for wp_num in range(0, 8))
+
+# Sheet columns read by TeamFetcher.fetch
+_SHEET_COLUMNS = (
+    "First name", "Surname", "Email", "Funded by Exa-MA", "Position", "WP", "Woman",
+    "Advisor", "Start date (if the person was not here from start)",
+    "End date (if the person has left)", "Other info", "Team", "Partner",
+    "Institution (employer)", *_WP_LABELS,
+)
+
 
 def is_nan(value: Any) -> bool:
     """Check if value is NaN or empty."""
@@ -48,56 +74,93 @@ def clean_string(value: Any) -> str | None:
     return str(value).strip()
 
 
+# Month names accepted in "Month Year" dates, lowercased -> month number
+_ENGLISH_MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7,
+    "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_FRENCH_MONTHS = {
+    "janvier": 1, "janv": 1,
+    "février": 2, "févr": 2, "fevrier": 2, "fevr": 2,
+    "mars": 3,
+    "avril": 4, "avr": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7, "juil": 7,
+    "août": 8, "aout": 8, "aoû": 8,
+    "septembre": 9, "sept": 9,
+    "octobre": 10, "oct": 10,
+    "novembre": 11, "nov": 11,
+    "décembre": 12, "déc": 12, "decembre": 12, "dec": 12,
+}
+_MONTH_NUM = {**_ENGLISH_MONTHS, **_FRENCH_MONTHS}
+
+
+def _month_year_re(names) -> re.Pattern[str]:
+    """Build a case-insensitive "<month> <year>" pattern (use with fullmatch)."""
+    alternation = "|".join(sorted(names, key=len, reverse=True))
+    return re.compile(rf"({alternation})\s+(\d{{4}})", re.IGNORECASE)
+
+
+_ENGLISH_MONTH_YEAR = _month_year_re(_ENGLISH_MONTHS)
+_FRENCH_MONTH_YEAR = _month_year_re(_FRENCH_MONTHS)
+
+
 def parse_date(value: Any) -> datetime | None:
     """Parse various date formats including French DD/MM/YYYY and Month Year formats."""
     if is_nan(value):
         return None
     if isinstance(value, datetime):
         return value
-    str_val = str(value).strip()
+    return _parse_date_str(str(value).strip())
+
+
+def _fast_parse_iso_or_dmy(token: str) -> datetime | None:
+    """Parse zero-padded YYYY-MM-DD, DD/MM/YYYY or DD-MM-YYYY without strptime.
+
+    Returns None for anything else (including invalid dates) so the
+    strptime cascade can handle it.
+    """
+    if len(token) != 10 or not token.isascii():
+        return None
+    if token[4] == "-" and token[7] == "-":
+        year, month, day = token[0:4], token[5:7], token[8:10]
+    elif token[2] in "/-" and token[5] == token[2]:
+        day, month, year = token[0:2], token[3:5], token[6:10]
+    else:
+        return None
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_str(str_val: str) -> datetime | None:
+    """Parse a stripped date string (memoized: sheets repeat the same dates)."""
+    token = str_val.split()[0]
+    parsed = _fast_parse_iso_or_dmy(token)
+    if parsed is not None:
+        return parsed
 
     # Try standard formats (French DD/MM/YYYY format is prioritized)
     for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
         try:
-            return datetime.strptime(str_val.split()[0], fmt)
+            return datetime.strptime(token, fmt)
         except (ValueError, TypeError):
             continue
 
-    # Try "Month Year" formats (English and French)
-    # English: "January 2024", "Jan 2024"
-    for fmt in ("%B %Y", "%b %Y"):
+    # Try "Month Year" formats: English ("January 2024", "Jan 2024"), then French
+    match = _ENGLISH_MONTH_YEAR.fullmatch(str_val) or _FRENCH_MONTH_YEAR.fullmatch(str_val)
+    if match:
         try:
-            return datetime.strptime(str_val, fmt)
-        except (ValueError, TypeError):
-            continue
-
-    # Try French month names
-    french_months = {
-        "janvier": "January", "janv": "Jan",
-        "février": "February", "févr": "Feb", "fevrier": "February", "fevr": "Feb",
-        "mars": "March",
-        "avril": "April", "avr": "Apr",
-        "mai": "May",
-        "juin": "June",
-        "juillet": "July", "juil": "Jul",
-        "août": "August", "aout": "August", "aoû": "Aug",
-        "septembre": "September", "sept": "Sep",
-        "octobre": "October", "oct": "Oct",
-        "novembre": "November", "nov": "Nov",
-        "décembre": "December", "déc": "Dec", "decembre": "December", "dec": "Dec",
-    }
-
-    # Try to parse French month names by converting to English
-    str_lower = str_val.lower()
-    for french, english in french_months.items():
-        if french in str_lower:
-            # Replace French month with English equivalent
-            str_english = str_lower.replace(french, english)
-            for fmt in ("%B %Y", "%b %Y"):
-                try:
-                    return datetime.strptime(str_english, fmt)
-                except (ValueError, TypeError):
-                    continue
+            return datetime(int(match.group(2)), _MONTH_NUM[match.group(1).lower()], 1)
+        except ValueError:
+            return None
 
     return None
 
@@ -145,17 +208,23 @@ MALE_NAMES = {
 }
 
 
+# Accent folding for name matching and slugs (the name lists only need one spelling)
+_ACCENT_TABLE = str.maketrans("éèêëàâäîïôöùûüçñ", "eeeeaaaiioouuucn")
+
+# Accent-folded first name -> gender, one lookup instead of two set probes
+_GENDER_LOOKUP: dict[str, Gender] = {
+    **{n.translate(_ACCENT_TABLE): Gender.FEMALE for n in FEMALE_NAMES},
+    **{n.translate(_ACCENT_TABLE): Gender.MALE for n in MALE_NAMES},
+}
+
+
+@lru_cache(maxsize=4096)
 def detect_gender(first_name: str) -> Gender:
     """Detect gender from first name using common name lists."""
     name_lower = first_name.lower().strip()
     # Handle compound names (e.g., "Jean-Pierre")
     first_part = name_lower.split("-")[0].split()[0]
-
-    if first_part in FEMALE_NAMES:
-        return Gender.FEMALE
-    if first_part in MALE_NAMES:
-        return Gender.MALE
-    return Gender.UNKNOWN
+    return _GENDER_LOOKUP.get(first_part.translate(_ACCENT_TABLE), Gender.UNKNOWN)
 
 
 class PositionType(str, Enum):
@@ -171,16 +240,26 @@ class PositionType(str, Enum):
         """Parse position type from string."""
         if not value:
             return cls.OTHER
-        value_lower = value.lower().strip()
-        if "phd" in value_lower or "thèse" in value_lower:
-            return cls.PHD
-        if "post" in value_lower:
-            return cls.POSTDOC
-        if "ir" in value_lower or "engineer" in value_lower or "ingénieur" in value_lower:
-            return cls.RESEARCH_ENGINEER
-        if "permanent" in value_lower or "cdi" in value_lower:
-            return cls.PERMANENT
-        return cls.OTHER
+        return _position_from_string(value)
+
+
+# Position keywords (substring matches on the lowercased value), in priority order
+_POSITION_KEYWORDS: list[tuple[re.Pattern[str], PositionType]] = [
+    (re.compile(r"phd|thèse"), PositionType.PHD),
+    (re.compile(r"post"), PositionType.POSTDOC),
+    (re.compile(r"ir|engineer|ingénieur"), PositionType.RESEARCH_ENGINEER),
+    (re.compile(r"permanent|cdi"), PositionType.PERMANENT),
+]
+
+
+@lru_cache(maxsize=256)
+def _position_from_string(value: str) -> PositionType:
+    """Resolve a raw position string (memoized: a handful of spellings repeat)."""
+    value_lower = value.lower().strip()
+    for pattern, position in _POSITION_KEYWORDS:
+        if pattern.search(value_lower):
+            return position
+    return PositionType.OTHER
 
 
 # Institution name normalization
@@ -198,6 +277,13 @@ INSTITUTION_NAMES = {
 }
 
 
+def _wp_sort_key(wp: str) -> int:
+    """Sort position of a work package group: its number, or 99 for anything else."""
+    match = _WP_LABEL_RE.fullmatch(wp)
+    return int(match.group(1)) if match else 99
+
+
+@lru_cache(maxsize=512)
 def normalize_institution(name: str | None) -> str:
     """Normalize institution name for display."""
     if not name:
@@ -205,6 +291,34 @@ def normalize_institution(name: str | None) -> str:
     return INSTITUTION_NAMES.get(name, name)
 
 
+# "Now" pinned for the duration of a render pass (see pinned_now)
+_NOW: ContextVar[datetime | None] = ContextVar("_NOW", default=None)
+
+
+def _now() -> datetime:
+    """Return the pinned render time, or the current time outside a render pass."""
+    now = _NOW.get()
+    return now if now is not None else datetime.now()
+
+
+@contextmanager
+def pinned_now(now: datetime | None = None) -> Iterator[datetime]:
+    """Use a single "now" for activity and duration checks inside the block.
+
+    Nested uses keep the outermost value. Also usable as a decorator.
+    """
+    current = _NOW.get()
+    if current is not None:
+        yield current
+        return
+    pinned = now or datetime.now()
+    token = _NOW.set(pinned)
+    try:
+        yield pinned
+    finally:
+        _NOW.reset(token)
+
+
 class RecruitedPerson(BaseModel):
     """A person recruited/funded by the Exa-MA project."""
 
@@ -227,32 +341,35 @@ class RecruitedPerson(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    @classmethod
+    def from_row(cls, data: dict[str, Any], trusted: bool = False) -> RecruitedPerson:
+        """Create an instance from parsed row fields.
+
+        Args:
+            data: Field values keyed by field name
+            trusted: Skip validation with ``model_construct``; values must
+                already have their final types (as produced by TeamFetcher)
+        """
+        if trusted:
+            return cls.model_construct(**data)
+        return cls.model_validate(data)
+
     @property
     def work_package(self) -> str | None:
         """Backward-compatible property returning primary (first) work package."""
         return self.work_packages[0] if self.work_packages else None
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Return full name."""
         return f"{self.first_name} {self.surname}"
 
-    @property
+    @cached_property
     def slug(self) -> str:
         """Return URL-safe slug for the person."""
-        name = f"{self.first_name}-{self.surname}".lower()
-        # Remove accents and special chars
-        replacements = {
-            "é": "e", "è": "e", "ê": "e", "ë": "e",
-            "à": "a", "â": "a", "ä": "a",
-            "î": "i", "ï": "i",
-            "ô": "o", "ö": "o",
-            "ù": "u", "û": "u", "ü": "u",
-            "ç": "c", "ñ": "n",
-        }
-        for old, new in replacements.items():
-            name = name.replace(old, new)
-        return re.sub(r"[^a-z0-9-]", "-", name)
+        # Remove accents, then special chars
+        name = f"{self.first_name}-{self.surname}".lower().translate(_ACCENT_TABLE)
+        return _SLUG_RE.sub("-", name)
 
     @property
     def gender(self) -> Gender:
@@ -266,24 +383,32 @@ class RecruitedPerson(BaseModel):
         """Check if the person is currently active (no end date or end date in future)."""
         if self.end_date is None:
             return True
-        return self.end_date > datetime.now()
+        return self.end_date > _now()
 
-    @property
+    @cached_property
     def wp_numbers(self) -> list[int]:
         """Extract WP numbers from all work packages."""
         numbers = []
         for wp in self.work_packages:
-            match = re.search(r"WP\s*(\d+)", wp, re.IGNORECASE)
+            match = _WP_RE.search(wp)
             if match:
                 numbers.append(int(match.group(1)))
         return sorted(numbers)
 
+    @cached_property
+    def work_package_title(self) -> str:
+        """Title of the primary work package, falling back to its label."""
+        wp = self.work_package
+        if wp is None:
+            return ""
+        return WP_TITLES.get(wp, wp)
+
     @property
     def wp_number(self) -> int | None:
         """Extract WP number from primary work package (backward compat)."""
         return self.wp_numbers[0] if self.wp_numbers else None
 
-    @property
+    @cached_property
     def position_display(self) -> str:
         """Return display-friendly position string."""
         position_map = {
@@ -295,7 +420,7 @@ class RecruitedPerson(BaseModel):
         }
         return position_map.get(self.position, self.position_raw or "Staff")
 
-    @property
+    @cached_property
     def institution_display(self) -> str:
         """Return normalized institution name.
 
@@ -312,25 +437,60 @@ class RecruitedPerson(BaseModel):
         # Has detailed info if other_info is substantial (>100 chars) or multi-line
         return len(self.other_info) > 100 or "\n" in self.other_info
 
-    @property
+    @cached_property
+    def advisors_cell(self) -> str:
+        """Advisors table cell, one per line."""
+        return " +\n".join(self.advisors)
+
+    @cached_property
+    def work_packages_cell(self) -> str:
+        """Work packages table cell with titles, one per line."""
+        return " +\n".join([_WP_CELL.get(wp, wp) for wp in self.work_packages])
+
+    @cached_property
+    def partner_norm(self) -> str:
+        """Return the normalized partner name."""
+        return normalize_institution(self.partner)
+
+    @cached_property
+    def institution_norm(self) -> str:
+        """Return the normalized employer name."""
+        return normalize_institution(self.institution)
+
+    @cached_property
+    def is_collaboration(self) -> bool:
+        """Whether the partner and the employer are different institutions."""
+        return (
+            bool(self.partner and self.institution)
+            and self.partner_norm != self.institution_norm
+        )
+
+    @cached_property
+    def collab_cell(self) -> str:
+        """Institution table cell, naming the partner when it differs from the employer."""
+        if self.is_collaboration:
+            return f"{self.institution_norm} +\n_(Partner: {self.partner_norm})_"
+        return self.institution_display
+
+    @cached_property
     def start_date_display(self) -> str:
         """Format start date for display."""
         if not self.start_date:
             return "Project start"
         return self.start_date.strftime("%B %Y")
 
-    @property
+    @cached_property
     def end_date_display(self) -> str | None:
         """Format end date for display."""
         if not self.end_date:
             return None
         return self.end_date.strftime("%B %Y")
 
-    @property
+    @cached_property
     def duration_display(self) -> str:
-        """Calculate and display duration."""
+        """Calculate and display duration (as of the first access)."""
         start = self.start_date or datetime(2023, 6, 1)  # Project start
-        end = self.end_date or datetime.now()
+        end = self.end_date or _now()
         months = (end.year - start.year) * 12 + (end.month - start.month)
         if months < 12:
             return f"{months} months"
@@ -364,24 +524,54 @@ class GenderStats(BaseModel):
         return (self.male / self.total) * 100
 
 
+@dataclass(slots=True)
+class PersonnelSummary:
+    """Breakdown of a collection's personnel, built in one pass by ``summarize``."""
+
+    active: list[RecruitedPerson] = field(default_factory=list)
+    funded: list[RecruitedPerson] = field(default_factory=list)
+    by_work_package: dict[str, list[RecruitedPerson]] = field(default_factory=dict)
+    by_position: dict[PositionType, list[RecruitedPerson]] = field(default_factory=dict)
+    by_partner: dict[str, list[RecruitedPerson]] = field(default_factory=dict)
+    gender_stats: GenderStats = field(default_factory=GenderStats)
+    unique: list[RecruitedPerson] = field(default_factory=list)
+    active_unique: list[RecruitedPerson] = field(default_factory=list)
+    pos_counts: dict[PositionType, int] = field(default_factory=dict)
+
+
 class RecruitedCollection(BaseModel):
-    """Collection of recruited personnel."""
+    """Collection of recruited personnel.
+
+    The derived views (active/funded personnel, gender stats and the
+    ``by_*`` groupings) are computed once and cached: ``personnel`` must not
+    be modified after the first of them has been accessed.
+    """
 
     personnel: list[RecruitedPerson] = Field(default_factory=list)
     source: str = "unknown"
     fetched_at: datetime = Field(default_factory=datetime.now)
 
-    @property
+    @cached_property
+    def _groups(self) -> dict[str, dict]:
+        """by_* groupings, keyed by method name, built on first use."""
+        return {}
+
+    @cached_property
+    def _deduplicated(self) -> dict[bool, RecruitedCollection]:
+        """deduplicated() results, keyed by active_only."""
+        return {}
+
+    @cached_property
     def active_personnel(self) -> list[RecruitedPerson]:
         """Return only currently active personnel."""
         return [p for p in self.personnel if p.is_active]
 
-    @property
+    @cached_property
     def funded_personnel(self) -> list[RecruitedPerson]:
         """Return only personnel funded by Exa-MA."""
         return [p for p in self.personnel if p.funded_by_exama]
 
-    @property
+    @cached_property
     def gender_stats(self) -> GenderStats:
         """Calculate gender statistics."""
         stats = GenderStats()
@@ -394,21 +584,87 @@ class RecruitedCollection(BaseModel):
                 stats.unknown += 1
         return stats
 
+    def summarize(self) -> PersonnelSummary:
+        """Compute active/funded/unique lists, groupings and stats in one pass.
+
+        Groupings are ordered like ``by_work_package``, ``by_position`` and
+        ``by_partner``; ``unique`` matches ``unique_personnel()``. The result
+        is cached like the other derived views.
+        """
+        return self._summary
+
+    @cached_property
+    def _summary(self) -> PersonnelSummary:
+        """summarize() result, built on first use."""
+        summary = PersonnelSummary()
+        active, funded = summary.active, summary.funded
+        unique, active_unique = summary.unique, summary.active_unique
+        by_wp, by_pos, by_partner = summary.by_work_package, summary.by_position, summary.by_partner
+        stats = summary.gender_stats
+        seen: set[str] = set()
+        for person in self.personnel:
+            is_active = person.is_active
+            if is_active:
+                active.append(person)
+            name = person.full_name
+            if name not in seen:
+                seen.add(name)
+                unique.append(person)
+                if is_active:
+                    active_unique.append(person)
+            if person.funded_by_exama:
+                funded.append(person)
+            for wp in person.work_packages or ["Unknown"]:
+                by_wp.setdefault(wp, []).append(person)
+            by_pos.setdefault(person.position, []).append(person)
+            partner = person.partner or person.institution or "Unknown"
+            by_partner.setdefault(partner, []).append(person)
+            gender = person.gender
+            if gender == Gender.MALE:
+                stats.male += 1
+            elif gender == Gender.FEMALE:
+                stats.female += 1
+            else:
+                stats.unknown += 1
+        summary.by_work_package = dict(sorted(by_wp.items(), key=lambda x: _wp_sort_key(x[0])))
+        summary.by_partner = dict(sorted(by_partner.items()))
+        summary.pos_counts = {pos: len(people) for pos, people in by_pos.items()}
+        return summary
+
     def unique_personnel(self) -> list[RecruitedPerson]:
-        """Return deduplicated list of personnel."""
-        seen = set()
-        unique = []
+        """Return deduplicated list of personnel (first entry per full name wins)."""
+        unique: dict[str, RecruitedPerson] = {}
         for p in self.personnel:
-            if p.full_name not in seen:
-                seen.add(p.full_name)
-                unique.append(p)
-        return unique
+            unique.setdefault(p.full_name, p)
+        return list(unique.values())
+
+    @cached_property
+    def sorted_by_surname(self) -> list[RecruitedPerson]:
+        """Return personnel sorted by surname (stable for equal surnames)."""
+        return sorted(self.personnel, key=lambda p: p.surname)
+
+    def deduplicated(self, active_only: bool = False) -> RecruitedCollection:
+        """Return a collection with one entry per full name, as used for rendering.
+
+        The last entry per full name wins, listed in order of first appearance.
+        The result is cached, so its own derived views are reused across renders.
+        """
+        if active_only not in self._deduplicated:
+            personnel = self.active_personnel if active_only else self.personnel
+            self._deduplicated[active_only] = RecruitedCollection(
+                personnel=list({p.full_name: p for p in personnel}.values()),
+                source=self.source,
+                fetched_at=self.fetched_at,
+            )
+        return self._deduplicated[active_only]
 
     def by_work_package(self) -> dict[str, list[RecruitedPerson]]:
         """Group personnel by work package.
 
         Note: A person working on multiple WPs will appear in each WP's list.
         """
+        if "by_work_package" in self._groups:
+            return self._groups["by_work_package"]
         result: dict[str, list[RecruitedPerson]] = {}
         for person in self.personnel:
             wps = person.work_packages if person.work_packages else ["Unknown"]
@@ -416,34 +672,50 @@ class RecruitedCollection(BaseModel):
                 if wp not in result:
                     result[wp] = []
                 result[wp].append(person)
-        return dict(sorted(result.items(), key=lambda x: (
-            int(x[0].replace("WP", "").strip()) if x[0].startswith("WP") else 99
-        )))
+        result = dict(sorted(result.items(), key=lambda x: _wp_sort_key(x[0])))
+        self._groups["by_work_package"] = result
+        return result
 
     def by_position(self) -> dict[PositionType, list[RecruitedPerson]]:
         """Group personnel by position type."""
+        if "by_position" in self._groups:
+            return self._groups["by_position"]
         result: dict[PositionType, list[RecruitedPerson]] = {}
         for person in self.personnel:
             if person.position not in result:
                 result[person.position] = []
             result[person.position].append(person)
+        self._groups["by_position"] = result
         return result
 
     def by_partner(self) -> dict[str, list[RecruitedPerson]]:
         """Group personnel by partner institution."""
+        if "by_partner" in self._groups:
+            return self._groups["by_partner"]
         result: dict[str, list[RecruitedPerson]] = {}
         for person in self.personnel:
             partner = person.partner or person.institution or "Unknown"
             if partner not in result:
                 result[partner] = []
             result[partner].append(person)
-        return dict(sorted(result.items()))
+        result = dict(sorted(result.items()))
+        self._groups["by_partner"] = result
+        return result
 
 
 # Default sheet ID for Exa-MA contact data
 DEFAULT_SHEET_ID = "1-QuexB1IiP2O1ebNhp1OrQb6hOx8BXA5"
 DEFAULT_SHEET_NAME = "All Exa-MA"  # Source of truth with all personnel
 
+# Seconds a cached download of the sheet is reused
+DEFAULT_SHEET_CACHE_TTL = 3600
+
+# Where downloaded sheets are kept when caching is enabled, next to the software cache
+DEFAULT_SHEET_CACHE_DIR = Path.home() / ".cache" / "exa-ma" / "team"
+
+# Shared opener for all fetchers in the process
+_URL_OPENER = urllib.request.build_opener()
+
 
 class TeamFetcher:
     """Fetch team/recruited personnel data from Google Sheets."""
@@ -456,72 +728,141 @@ class TeamFetcher:
         self,
         sheet_id: str,
         sheet_name: str = DEFAULT_SHEET_NAME,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float = DEFAULT_SHEET_CACHE_TTL,
+        force_refresh: bool = False,
     ):
-        """Initialize team fetcher."""
+        """Initialize team fetcher.
+
+        Args:
+            sheet_id: Google Sheets document ID
+            sheet_name: Sheet to read
+            cache_dir: Directory for downloaded sheets (None disables caching,
+                       e.g. DEFAULT_SHEET_CACHE_DIR)
+            cache_ttl: Seconds a cached download is reused
+            force_refresh: Download the sheet even if a fresh copy is cached
+        """
         self.sheet_id = sheet_id
         self.sheet_name = sheet_name
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.force_refresh = force_refresh
         self._excel_data: bytes | None = None
 
+    def _cache_path(self) -> Path | None:
+        """Path of the on-disk copy of the downloaded spreadsheet, if caching."""
+        if self.cache_dir is None:
+            return None
+        # Hash the ID so it is always a safe file name
+        key = hashlib.sha256(self.sheet_id.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{key}.xlsx"
+
     def _fetch_excel(self) -> bytes:
-        """Fetch the spreadsheet as XLSX bytes."""
+        """Fetch the spreadsheet as XLSX bytes.
+
+        With a ``cache_dir``, downloads are kept on disk for ``cache_ttl``
+        seconds so repeated runs do not hit Google Sheets every time, unless
+        ``force_refresh`` is set.
+        """
         if self._excel_data is not None:
             return self._excel_data
 
+        cache_path = self._cache_path()
+        if cache_path is not None and not self.force_refresh:
+            try:
+                if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                    self._excel_data = cache_path.read_bytes()
+                    print(f"Using cached sheet {self.sheet_id} from {cache_path}")
+                    return self._excel_data
+            except OSError:
+                pass  # No usable cached copy
+
         url = self.EXPORT_URL_TEMPLATE.format(sheet_id=self.sheet_id)
 
         try:
-            response = urllib.request.urlopen(url)
-            self._excel_data = response.read()
-            return self._excel_data
+            with _URL_OPENER.open(url) as response:
+                self._excel_data = response.read()
         except Exception as e:
             raise RuntimeError(
                 f"Failed to fetch Google Sheet. "
                 f"Ensure the sheet is publicly accessible. Error: {e}"
             )
 
-    def get_sheet_names(self) -> list[str]:
-        """Get list of available sheet names."""
+        if cache_path is None:
+            return self._excel_data
+
+        # Write atomically so concurrent runs never read a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(self._excel_data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+        return self._excel_data
+
+    def _open_workbook(self):
+        """Open the downloaded spreadsheet with openpyxl in read-only mode."""
         try:
-            import pandas as pd
+            import openpyxl
         except ImportError:
-            raise ImportError("pandas is required. Install with: pip install pandas")
+            raise ImportError("openpyxl is required. Install with: pip install openpyxl")
 
-        data = self._fetch_excel()
-        xl = pd.ExcelFile(io.BytesIO(data))
-        return xl.sheet_names
+        return openpyxl.load_workbook(
+            io.BytesIO(self._fetch_excel()), read_only=True, data_only=True
+        )
 
-    def _load_sheet(self, sheet_name: str | None = None):
-        """Load a specific sheet as pandas DataFrame."""
+    def get_sheet_names(self) -> list[str]:
+        """Get list of available sheet names."""
+        wb = self._open_workbook()
         try:
-            import pandas as pd
-        except ImportError:
-            raise ImportError("pandas is required. Install with: pip install pandas")
-
-        data = self._fetch_excel()
-        # Disable automatic date parsing to ensure we use our custom parse_date function
-        # which correctly handles French DD/MM/YYYY format
-        return pd.read_excel(
-            io.BytesIO(data),
-            sheet_name=sheet_name or self.sheet_name,
-            parse_dates=False,  # Disable auto date parsing
-            date_format=None,   # Don't infer date format
-        )
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+
+    def _iter_rows(
+        self, sheet_name: str | None = None, columns: Iterable[str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a sheet as dicts keyed by the header row.
+
+        Uses openpyxl in read-only mode, so neither the workbook nor a
+        DataFrame is fully materialized.
+
+        Args:
+            sheet_name: Sheet to read (defaults to the fetcher's sheet)
+            columns: Only keep these columns; for repeated headers the
+                first occurrence wins
+        """
+        wb = self._open_workbook()
+        try:
+            rows = wb[sheet_name or self.sheet_name].iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                return
+            wanted = None if columns is None else frozenset(columns)
+            index: dict[Any, int] = {}
+            for i, header in enumerate(headers):
+                if header is None or header in index:
+                    continue
+                if wanted is None or header in wanted:
+                    index[header] = i
+            fields = tuple(index.items())
+            for values in rows:
+                n = len(values)
+                yield {name: values[i] if i < n else None for name, i in fields}
+        finally:
+            wb.close()
 
     def _parse_work_packages(self, row: dict) -> list[str]:
         """Parse WP columns (WP0-WP7) to get all work packages.
 
         Returns all WPs where the person has involvement, sorted by WP number.
         """
-        wp_involvement = []
         # Include WP0 (Project Office) through WP7
-        for wp_num in range(0, 8):
-            wp_col = f"WP{wp_num}"
-            value = row.get(wp_col)
-            if not is_nan(value) and isinstance(value, (int, float)) and value > 0:
-                wp_involvement.append(wp_num)
-
-        # Return sorted list of WP strings
-        return [f"WP{num}" for num in sorted(wp_involvement)]
+        return [
+            wp_col for wp_col in _WP_LABELS
+            if isinstance(value := row.get(wp_col), (int, float)) and value > 0
+        ]
 
     def _parse_gender_from_column(self, row: dict) -> Gender:
         """Parse gender from the 'Woman' column."""
@@ -548,14 +889,15 @@ class TeamFetcher:
             return []
 
         # Split by common separators: comma, semicolon, or newline
-        import re
-        advisors = re.split(r"[,;\n]+", advisor_str)
+        advisors = _ADVISOR_SPLIT.split(advisor_str)
         return [a.strip() for a in advisors if a.strip()]
 
-    def _parse_row(self, row: dict) -> RecruitedPerson | None:
+    def _parse_row(self, row: dict, validate: bool = False) -> RecruitedPerson | None:
         """Parse a single row into a RecruitedPerson.
 
         Supports both 'All Exa-MA' sheet format and 'Recruitments only' format.
+        Parsed values already have their final types, so the person is built
+        without pydantic validation unless ``validate`` is set.
         """
         first_name = clean_string(row.get("First name"))
         surname = clean_string(row.get("Surname"))
@@ -570,7 +912,7 @@ class TeamFetcher:
             if isinstance(funded_raw, bool):
                 funded = funded_raw
             elif isinstance(funded_raw, (int, float)):
-                funded = funded_raw == 1
+                funded = bool(funded_raw == 1)
             else:
                 funded = str(funded_raw).lower() in ("1", "yes", "true", "x")
 
@@ -586,22 +928,22 @@ class TeamFetcher:
         # Parse gender - use 'Woman' column if available, otherwise detect from name
         gender_from_col = self._parse_gender_from_column(row)
 
-        person = RecruitedPerson(
-            first_name=first_name,
-            surname=surname,
-            email=clean_string(row.get("Email")),
-            work_packages=work_packages,
-            funded_by_exama=funded,
-            start_date=parse_date(row.get("Start date (if the person was not here from start)")),
-            end_date=parse_date(row.get("End date (if the person has left)")),
-            other_info=clean_string(row.get("Other info")),
-            position=PositionType.from_string(position_raw),
-            position_raw=position_raw,
-            team=clean_string(row.get("Team")),
-            partner=clean_string(row.get("Partner")),
-            institution=clean_string(row.get("Institution (employer)")),
-            advisors=self._parse_advisors(row),
-        )
+        person = RecruitedPerson.from_row({
+            "first_name": first_name,
+            "surname": surname,
+            "email": clean_string(row.get("Email")),
+            "work_packages": work_packages,
+            "funded_by_exama": funded,
+            "start_date": parse_date(row.get("Start date (if the person was not here from start)")),
+            "end_date": parse_date(row.get("End date (if the person has left)")),
+            "other_info": clean_string(row.get("Other info")),
+            "position": PositionType.from_string(position_raw),
+            "position_raw": position_raw,
+            "team": clean_string(row.get("Team")),
+            "partner": clean_string(row.get("Partner")),
+            "institution": clean_string(row.get("Institution (employer)")),
+            "advisors": self._parse_advisors(row),
+        }, trusted=not validate)
 
         # Override gender detection with explicit column value if available
         person._gender_override = gender_from_col
@@ -609,18 +951,20 @@ class TeamFetcher:
         return person
 
     def fetch(self, funded_only: bool = False, active_only: bool = False) -> RecruitedCollection:
-        """Fetch all recruited personnel."""
-        df = self._load_sheet()
-        personnel = []
+        """Fetch all recruited personnel.
 
-        for _, row in df.iterrows():
-            person = self._parse_row(row.to_dict())
-            if person:
-                if funded_only and not person.funded_by_exama:
-                    continue
-                if active_only and not person.is_active:
-                    continue
-                personnel.append(person)
+        The sheet is streamed with openpyxl and each row is parsed as it is read.
+        """
+        personnel = []
+        for row in self._iter_rows(columns=_SHEET_COLUMNS):
+            person = self._parse_row(row)
+            if person is None:
+                continue
+            if funded_only and not person.funded_by_exama:
+                continue
+            if active_only and not person.is_active:
+                continue
+            personnel.append(person)
 
         return RecruitedCollection(
             personnel=personnel,
@@ -634,9 +978,18 @@ def fetch_recruited(
     sheet_name: str = DEFAULT_SHEET_NAME,
     funded_only: bool = True,
     active_only: bool = False,
+    cache_dir: str | Path | None = None,
+    cache_ttl: float = DEFAULT_SHEET_CACHE_TTL,
+    force_refresh: bool = False,
 ) -> RecruitedCollection:
     """Convenience function to fetch recruited personnel."""
-    fetcher = TeamFetcher(sheet_id=sheet_id, sheet_name=sheet_name)
+    fetcher = TeamFetcher(
+        sheet_id=sheet_id,
+        sheet_name=sheet_name,
+        cache_dir=cache_dir,
+        cache_ttl=cache_ttl,
+        force_refresh=force_refresh,
+    )
     return fetcher.fetch(funded_only=funded_only, active_only=active_only)
 
 
@@ -644,6 +997,9 @@ def fetch_recruited_with_config(
     config_path: Path | str | None = None,
     funded_only: bool | None = None,
     active_only: bool | None = None,
+    cache_dir: str | Path | None = None,
+    cache_ttl: float = DEFAULT_SHEET_CACHE_TTL,
+    force_refresh: bool = False,
 ) -> RecruitedCollection:
     """Fetch recruited personnel using unified configuration.
 
@@ -651,6 +1007,9 @@ def fetch_recruited_with_config(
         config_path: Optional path to exama.yaml config file
         funded_only: Override config's funded_only setting
         active_only: Override config's active_only setting
+        cache_dir: Directory for downloaded sheets (None disables caching)
+        cache_ttl: Seconds a cached download is reused
+        force_refresh: Download the sheet even if a fresh copy is cached
 
     Returns:
         RecruitedCollection with fetched personnel
@@ -684,6 +1043,9 @@ def fetch_recruited_with_config(
         sheet_name=sheet_name,
         funded_only=filter_funded_only,
         active_only=filter_active_only,
+        cache_dir=cache_dir,
+        cache_ttl=cache_ttl,
+        force_refresh=force_refresh,
     )
 
 
@@ -699,7 +1061,21 @@ WP_TITLES = {
     "WP7": "Showroom, Benchmarking and Co-Design coordination",
 }
 
+# Preformatted "WPx: Title" table cells
+_WP_CELL = {wp: (f"{wp}: {title}" if title else wp) for wp, title in WP_TITLES.items()}
 
+
+# One row of the recruited personnel table (cells are already formatted)
+_RECRUITED_ROW = "|{surname}\n|{firstname}\n|{wp}\n|{inst}\n|{period}\n|{advisor}\n\n"
+
+# Quote block for one work package in the WP-grouped team view
+_WP_GROUP = "____\n*{title}*\n\n{bullets}____\n\n"
+
+# Threads used to write individual person pages
+_PAGE_WRITE_WORKERS = 8
+
+
+@pinned_now()
 def generate_person_page(person: RecruitedPerson) -> str:
     """Generate an individual AsciiDoc page for a person with detailed info.
 
@@ -709,57 +1085,42 @@ def generate_person_page(person: RecruitedPerson) -> str:
     Returns:
         AsciiDoc page content
     """
-    lines = []
-
-    # Page header
-    lines.append(f"= {person.full_name}")
-    lines.append(f":page-role: recruited-person")
-    lines.append(f":page-position: {person.position_display}")
-    lines.append(f":page-wp: {person.work_package or 'N/A'}")
-    lines.append(f":page-institution: {person.institution_display}")
-    lines.append("")
-
-    # Profile section
-    lines.append("[.person-profile]")
-    lines.append("--")
-
-    # Basic info card
-    lines.append("[.info-card]")
-    lines.append("====")
-    lines.append(f"[.position]*{person.position_display}*")
-    lines.append("")
-
+    work_package = ""
     if person.work_package:
-        wp_title = WP_TITLES.get(person.work_package, person.work_package)
-        lines.append(f"*Work Package:* {person.work_package} - {wp_title}")
-        lines.append("")
-
-    lines.append(f"*Institution:* {person.institution_display}")
-    lines.append("")
-
-    # Dates
-    lines.append(f"*Started:* {person.start_date_display}")
-    if person.end_date_display:
-        lines.append(f" +")
-        lines.append(f"*Ended:* {person.end_date_display}")
-    lines.append("")
-    lines.append(f"*Duration:* {person.duration_display}")
-    lines.append("====")
-    lines.append("--")
-    lines.append("")
-
-    # Work description section
+        work_package = f"*Work Package:* {person.work_package} - {person.work_package_title}\n\n"
+    ended = f"\n +\n*Ended:* {person.end_date_display}" if person.end_date_display else ""
+    research = ""
     if person.other_info:
-        lines.append("== Research Work")
-        lines.append("")
         # Convert newlines to proper AsciiDoc formatting
         info_lines = person.other_info.replace("\n", " +\n")
-        lines.append(info_lines)
-        lines.append("")
-
-    return "\n".join(lines)
+        research = f"\n== Research Work\n\n{info_lines}\n"
+
+    return (
+        f"= {person.full_name}\n"
+        f":page-role: recruited-person\n"
+        f":page-position: {person.position_display}\n"
+        f":page-wp: {person.work_package or 'N/A'}\n"
+        f":page-institution: {person.institution_display}\n"
+        f"\n"
+        f"[.person-profile]\n"
+        f"--\n"
+        f"[.info-card]\n"
+        f"====\n"
+        f"[.position]*{person.position_display}*\n"
+        f"\n"
+        f"{work_package}"
+        f"*Institution:* {person.institution_display}\n"
+        f"\n"
+        f"*Started:* {person.start_date_display}{ended}\n"
+        f"\n"
+        f"*Duration:* {person.duration_display}\n"
+        f"====\n"
+        f"--\n"
+        f"{research}"
+    )
 
 
+@pinned_now()
 def generate_recruited_section(
     collection: RecruitedCollection,
     active_only: bool = False,
@@ -779,34 +1140,36 @@ def generate_recruited_section(
     Returns:
         Complete AsciiDoc section string
     """
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Use active personnel if requested and deduplicate
-    personnel = collection.active_personnel if active_only else collection.personnel
-    personnel = list({p.full_name: p for p in personnel}.values())
+    unique = collection.deduplicated(active_only)
+    personnel = unique.personnel
 
     # Calculate statistics
     total = len(personnel)
-    temp_collection = RecruitedCollection(personnel=personnel)
-    by_pos = temp_collection.by_position()
-    gender_stats = temp_collection.gender_stats
+    summary = unique.summarize()
+    by_pos = summary.by_position
+    pos_counts = summary.pos_counts
+    gender_stats = summary.gender_stats
 
     # Generate individual pages if requested
     people_with_pages = []
     if generate_individual_pages and output_dir:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        for person in personnel:
-            if person.has_detailed_info:
-                page_content = generate_person_page(person)
-                page_path = output_dir / f"{person.slug}.adoc"
-                page_path.write_text(page_content)
-                people_with_pages.append(person)
+        people_with_pages = [person for person in personnel if person.has_detailed_info]
+        # Render here (under this pass's pinned time), write the files concurrently
+        pages = [
+            (output_dir / f"{person.slug}.adoc", generate_person_page(person))
+            for person in people_with_pages
+        ]
+        with ThreadPoolExecutor(max_workers=_PAGE_WRITE_WORKERS) as executor:
+            list(executor.map(lambda page: page[0].write_text(page[1]), pages))
 
     # Comment with total count
-    lines.append(f"// Total recruited personnel: {total}")
-    lines.append(":sectnums!:")
-    lines.append("")
+    w(f"// Total recruited personnel: {total}\n:sectnums!:\n\n")
 
     # Position type config
     position_config = {
@@ -837,26 +1200,31 @@ def generate_recruited_section(
         people = by_pos[pos_type]
         config = position_config.get(pos_type, {"title": pos_type.value, "icon": "user"})
 
-        lines.append("[discrete]")
-        lines.append(f"== icon:{config['icon']}[] {config['title']}")
-        lines.append("")
-        lines.append(f"_{len(people)} personnel_")
-        lines.append("")
+        w(
+            f"[discrete]\n"
+            f"== icon:{config['icon']}[] {config['title']}\n"
+            f"\n"
+            f"_{pos_counts[pos_type]} personnel_\n"
+            f"\n"
+        )
 
         # Table header - Last name first, then First name
-        lines.append("[.striped.recruited,cols=\"2,2,2,2,2,2\",options=\"header\"]")
-        lines.append("|===")
-        lines.append("|Last Name |First Name |Work Package |Institution |Period |Advisor(s)")
-        lines.append("")
-
-        # Sort by primary work package first, then by surname
-        def sort_key(p):
-            # Primary WP number for sorting (Unknown = 99)
-            wp_nums = p.wp_numbers
-            wp_num = wp_nums[0] if wp_nums else 99
-            return (wp_num, p.surname.lower())
-
-        for person in sorted(people, key=sort_key):
+        w(
+            "[.striped.recruited,cols=\"2,2,2,2,2,2\",options=\"header\"]\n"
+            "|===\n"
+            "|Last Name |First Name |Work Package |Institution |Period |Advisor(s)\n"
+            "\n"
+        )
+
+        # Sort by primary work package first (Unknown = 99), then by surname.
+        # The index keeps the sort stable and never lets ties compare persons.
+        decorated = [
+            (p.wp_numbers[0] if p.wp_numbers else 99, p.surname.lower(), i, p)
+            for i, p in enumerate(people)
+        ]
+        decorated.sort()
+
+        for _, _, _, person in decorated:
             # Last name with optional link to individual page
             if person in people_with_pages:
                 surname_str = f"*xref:team/{person.slug}.adoc[{person.surname}]*"
@@ -867,25 +1235,10 @@ def generate_recruited_section(
             firstname_str = person.first_name
 
             # Work packages (show all, with titles)
-            wp_str = ""
-            if person.work_packages:
-                wp_parts = []
-                for wp in person.work_packages:
-                    wp_title = WP_TITLES.get(wp, "")
-                    if wp_title:
-                        wp_parts.append(f"{wp}: {wp_title}")
-                    else:
-                        wp_parts.append(wp)
-                wp_str = " +\n".join(wp_parts)  # Line break between multiple WPs
-
-            # Institution (employer) and Partner (collaboration)
-            inst_str = person.institution_display
-            # Show partner if different from institution to highlight collaborations
-            if person.partner and person.institution:
-                partner_norm = normalize_institution(person.partner)
-                inst_norm = normalize_institution(person.institution)
-                if partner_norm != inst_norm:
-                    inst_str = f"{inst_norm} +\n_(Partner: {partner_norm})_"
+            wp_str = person.work_packages_cell
+
+            # Institution (employer), with the partner when it highlights a collaboration
+            inst_str = person.collab_cell
 
             # Period
             period_str = person.start_date_display
@@ -895,43 +1248,45 @@ def generate_recruited_section(
                 period_str += " - Present"
 
             # Advisors (show all, with line breaks)
-            advisor_str = " +\n".join(person.advisors) if person.advisors else ""
+            advisor_str = person.advisors_cell
 
-            lines.append(f"|{surname_str}")
-            lines.append(f"|{firstname_str}")
-            lines.append(f"|{wp_str}")
-            lines.append(f"|{inst_str}")
-            lines.append(f"|{period_str}")
-            lines.append(f"|{advisor_str}")
-            lines.append("")
+            w(_RECRUITED_ROW.format_map({
+                "surname": surname_str,
+                "firstname": firstname_str,
+                "wp": wp_str,
+                "inst": inst_str,
+                "period": period_str,
+                "advisor": advisor_str,
+            }))
 
-        lines.append("|===")
-        lines.append("")
+        w("|===\n\n")
 
     # Add KPI summary at the end
-    phd_count = len(by_pos.get(PositionType.PHD, []))
-    postdoc_count = len(by_pos.get(PositionType.POSTDOC, []))
-    engineer_count = len(by_pos.get(PositionType.RESEARCH_ENGINEER, []))
-
-    lines.append("[discrete]")
-    lines.append("== Key Indicators")
-    lines.append("")
-    lines.append("[.striped,cols=\"2,1\",options=\"header\"]")
-    lines.append("|===")
-    lines.append("|Indicator |Value")
-    lines.append("")
-    lines.append(f"|Total Recruited Personnel |*{total}*")
-    lines.append(f"|PhD Students |{phd_count}")
-    lines.append(f"|Postdoctoral Researchers |{postdoc_count}")
-    lines.append(f"|Research Engineers |{engineer_count}")
-    lines.append(f"|Women |{gender_stats.female} ({gender_stats.female_percentage:.0f}%)")
-    lines.append(f"|Men |{gender_stats.male} ({gender_stats.male_percentage:.0f}%)")
-    lines.append("|===")
-    lines.append("")
-
-    return "\n".join(lines)
+    phd_count = pos_counts.get(PositionType.PHD, 0)
+    postdoc_count = pos_counts.get(PositionType.POSTDOC, 0)
+    engineer_count = pos_counts.get(PositionType.RESEARCH_ENGINEER, 0)
+
+    w(
+        f"[discrete]\n"
+        f"== Key Indicators\n"
+        f"\n"
+        f"[.striped,cols=\"2,1\",options=\"header\"]\n"
+        f"|===\n"
+        f"|Indicator |Value\n"
+        f"\n"
+        f"|Total Recruited Personnel |*{total}*\n"
+        f"|PhD Students |{phd_count}\n"
+        f"|Postdoctoral Researchers |{postdoc_count}\n"
+        f"|Research Engineers |{engineer_count}\n"
+        f"|Women |{gender_stats.female} ({gender_stats.female_percentage:.0f}%)\n"
+        f"|Men |{gender_stats.male} ({gender_stats.male_percentage:.0f}%)\n"
+        f"|===\n"
+    )
+
+    return buf.getvalue()
 
 
+@pinned_now()
 def generate_team_asciidoc(
     collection: RecruitedCollection,
     include_email: bool = False,
@@ -952,62 +1307,62 @@ def generate_team_asciidoc(
     if group_by == "position":
         return generate_recruited_section(collection, active_only=active_only)
 
-    lines = []
-    personnel = collection.active_personnel if active_only else collection.personnel
-    personnel = list({p.full_name: p for p in personnel}.values())
-    temp_collection = RecruitedCollection(personnel=personnel)
+    buf = io.StringIO()
+    w = buf.write
+    # Sort once; the groupings below keep this order within each group
+    temp_collection = RecruitedCollection(
+        personnel=collection.deduplicated(active_only).sorted_by_surname
+    )
 
     if group_by == "wp":
         grouped = temp_collection.by_work_package()
 
-        lines.append("[.grid.grid-2.gap-2]")
-        lines.append("====")
+        w("[.grid.grid-2.gap-2]\n====\n")
 
         for wp, people in grouped.items():
-            title = f"{wp}: {WP_TITLES.get(wp, '')}"
-            lines.append("____")
-            lines.append(f"*{title}*")
-            lines.append("")
-            for person in sorted(people, key=lambda p: p.surname):
-                email_part = f" ({person.email})" if include_email and person.email else ""
-                position_part = f" _({person.position_display})_"
-                lines.append(f"- {person.full_name}{position_part}{email_part}")
-            lines.append("____")
-            lines.append("")
-
-        lines.append("====")
+            bullets = "".join([
+                f"- {person.full_name} _({person.position_display})_"
+                f"{f' ({person.email})' if include_email and person.email else ''}\n"
+                for person in people
+            ])
+            w(_WP_GROUP.format(title=f"{wp}: {WP_TITLES.get(wp, '')}", bullets=bullets))
+
+        w("====")
 
     elif group_by == "partner":
         grouped = temp_collection.by_partner()
-        for partner, people in grouped.items():
-            lines.append(f"=== {normalize_institution(partner)}")
-            lines.append("")
-            for person in sorted(people, key=lambda p: p.surname):
-                wp_part = f" ({person.work_package})" if person.work_package else ""
-                lines.append(f"- {person.full_name} _{person.position_display}_{wp_part}")
-            lines.append("")
+        for i, (partner, people) in enumerate(grouped.items()):
+            # Blank line between groups, none after the last one
+            if i:
+                w("\n")
+            w(f"=== {normalize_institution(partner)}\n\n")
+            w("".join([
+                f"- {person.full_name} _{person.position_display}_"
+                f"{f' ({person.work_package})' if person.work_package else ''}\n"
+                for person in people
+            ]))
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
     # Quick test
     collection = fetch_recruited(funded_only=True)
-    personnel = collection.unique_personnel()
-    print(f"Fetched {len(personnel)} unique recruited personnel")
-    print(f"Active: {len([p for p in personnel if p.is_active])}")
+    # unique/active_unique keep the first entry per full name
+    summary = collection.summarize()
+    print(f"Fetched {len(summary.unique)} unique recruited personnel")
+    print(f"Active: {len(summary.active_unique)}")
 
     # Gender stats
-    stats = collection.gender_stats
+    stats = summary.gender_stats
     print(f"\nGender Statistics:")
     print(f"  Male: {stats.male} ({stats.male_percentage:.1f}%)")
     print(f"  Female: {stats.female} ({stats.female_percentage:.1f}%)")
     print(f"  Unknown: {stats.unknown}")
 
     print("\nBy Position:")
-    for pos, people in collection.by_position().items():
-        unique_people = list({p.full_name: p for p in people}.values())
-        print(f"  {pos.value}: {len(unique_people)}")
+    for pos, people in summary.by_position.items():
+        print(f"  {pos.value}: {len({p.full_name for p in people})}")
 
     print("\n" + "=" * 50)
     print("Generated AsciiDoc:\n")
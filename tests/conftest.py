@@ -1,15 +1,15 @@
 """Pytest fixtures for Exa-MA harvest tests."""
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 import yaml
 
+# libyaml's emitter when available, the pure-Python one otherwise
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@pytest.fixture
-def sample_exama_config() -> dict:
-    """Sample exama.yaml configuration."""
+
+def _sample_exama_config() -> dict:
     return {
         "project": {
             "name": "Exa-MA",
@@ -68,9 +68,7 @@ def sample_exama_config() -> dict:
     }
 
 
-@pytest.fixture
-def sample_news_config() -> dict:
-    """Sample news.yaml configuration."""
+def _sample_news_config() -> dict:
     return {
         "events": [
             {
@@ -98,22 +96,34 @@ def sample_news_config() -> dict:
 
 
 @pytest.fixture
-def temp_config_dir(sample_exama_config, sample_news_config):
-    """Create a temporary directory with config files."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-
-        # Write exama.yaml
-        exama_path = tmpdir / "exama.yaml"
-        with open(exama_path, "w") as f:
-            yaml.dump(sample_exama_config, f)
-
-        # Write news.yaml
-        news_path = tmpdir / "news.yaml"
-        with open(news_path, "w") as f:
-            yaml.dump(sample_news_config, f)
-
-        yield tmpdir
+def sample_exama_config() -> dict:
+    """Sample exama.yaml configuration."""
+    return _sample_exama_config()
+
+
+@pytest.fixture
+def sample_news_config() -> dict:
+    """Sample news.yaml configuration."""
+    return _sample_news_config()
+
+
+@pytest.fixture(scope="session")
+def temp_config_dir(tmp_path_factory) -> Path:
+    """Directory with the sample config files, shared by the whole session.
+
+    Treat it as read-only: tests that write config files should use ``tmp_path``.
+    """
+    tmpdir = tmp_path_factory.mktemp("config")
+
+    # Write exama.yaml
+    with open(tmpdir / "exama.yaml", "w") as f:
+        yaml.dump(_sample_exama_config(), f, Dumper=_YAML_DUMPER)
+
+    # Write news.yaml
+    with open(tmpdir / "news.yaml", "w") as f:
+        yaml.dump(_sample_news_config(), f, Dumper=_YAML_DUMPER)
+
+    return tmpdir
 
 
 @pytest.fixture
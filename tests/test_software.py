@@ -0,0 +1,173 @@
+"""Tests for software and application metadata."""
+
+import json
+from datetime import datetime
+
+import openpyxl
+
+from harvest.software.cache import SoftwareCache
+from harvest.software.config import FrameworkConfig, GenerationConfig
+from harvest.software.fetcher import ExcelFetcher
+from harvest.software.models import (
+    BenchmarkStatus,
+    PackagingInfo,
+    SoftwareCollection,
+    SoftwarePackage,
+    WorkPackageInfo,
+)
+
+
+def _collection() -> SoftwareCollection:
+    """Small collection exercising nested, list and datetime fields."""
+    return SoftwareCollection(
+        packages=[
+            SoftwarePackage(
+                name="Feel++",
+                repository="https://github.com/feelpp/feelpp",
+                license="OSS:: LGPL v3",
+                languages="C++\nPython",
+                devops="Continuous Integration, Unit tests",
+                benchmark_status=BenchmarkStatus.BOTH,
+                work_packages=[WorkPackageInfo(wp_number=1, topics=["fem"], benchmarked=True)],
+                packaging=PackagingInfo(
+                    software_name="Feel++",
+                    spack_available=True,
+                    last_updated=datetime(2024, 5, 1),
+                ),
+            ),
+            SoftwarePackage(name="Hawen", license="GPL"),
+        ],
+        source_file="sheet.xlsx",
+        fetched_at=datetime(2024, 6, 1, 12, 30),
+    )
+
+
+class TestSoftwareCollection:
+    """Tests for SoftwareCollection lookups."""
+
+    def test_lookups(self):
+        """Test name and work package lookups."""
+        collection = _collection()
+
+        assert collection.get_by_name("FEEL++").name == "Feel++"
+        assert collection.get_by_name("missing") is None
+        assert [p.name for p in collection.get_by_work_package(1)] == ["Feel++"]
+        assert collection.get_by_work_package(2) == []
+        assert [p.name for p in collection.eligible_packages] == ["Feel++"]
+
+    def test_cached_lookups_do_not_affect_equality(self):
+        """Test that building lookup indexes leaves model equality unchanged."""
+        collection = _collection()
+        other = _collection()
+
+        collection.get_by_name("feel++")
+        collection.get_by_work_package(1)
+        package = collection.packages[0]
+        assert package.wp_numbers == frozenset({1})
+        assert package.has_public_repository
+        assert package.has_ci and package.has_unit_tests
+        assert package.packaging.community_packages == ["Spack"]
+
+        assert collection == other
+        assert collection.model_dump() == other.model_dump()
+
+
+class TestSoftwareCache:
+    """Tests for SoftwareCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a cached collection loads back equal."""
+        cache = SoftwareCache(cache_dir=tmp_path)
+        collection = _collection()
+
+        cache.set("sheet.xlsx", collection)
+        loaded = cache.get("sheet.xlsx")
+
+        assert loaded == collection
+        assert loaded.get_by_name("feel++").packaging.has_any_package
+
+    def test_entry_data_is_not_double_encoded(self, tmp_path):
+        """Test that the collection is stored as a JSON object, not a string."""
+        cache = SoftwareCache(cache_dir=tmp_path)
+        cache.set("sheet.xlsx", _collection())
+
+        (cache_file,) = tmp_path.glob("*.json")
+        data = json.loads(cache_file.read_text())["data"]
+
+        assert data["packages"][0]["name"] == "Feel++"
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        """Test that expired entries are missed and removed."""
+        cache = SoftwareCache(cache_dir=tmp_path, ttl_seconds=-1)
+        cache.set("sheet.xlsx", _collection())
+
+        assert cache.get("sheet.xlsx") is None
+        assert not list(tmp_path.glob("*.json"))
+
+
+class TestExcelFetcher:
+    """Tests for ExcelFetcher sheet parsing."""
+
+    def test_first_duplicate_header_wins(self, tmp_path):
+        """Test that a repeated header keeps the first column's values."""
+        path = tmp_path / "software.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Frameworks"
+        ws.append(["Name", "License", "License"])
+        ws.append(["Feel++", "LGPL", "MIT"])
+        ws.append(["Short row"])
+        wb.save(path)
+
+        rows = list(ExcelFetcher(path)._iter_rows("Frameworks"))
+
+        assert rows == [
+            {"Name": "Feel++", "License": "LGPL"},
+            {"Name": "Short row", "License": None},
+        ]
+
+    def test_wp_benchmarked_flags(self, tmp_path):
+        """Test that Excel and pandas (Google Sheets) rows agree on WP benchmark flags."""
+        path = tmp_path / "software.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Frameworks"
+        ws.append(["Name", "WP1", "WP1 Benchmarked", "WP2", "WP2 Benchmarked"])
+        ws.append(["Num", "fem", None, "rom", 1])
+        wb.create_sheet("Packaging").append(["Software Name"])
+        wb.save(path)
+
+        (package,) = ExcelFetcher(path).fetch().packages
+        # What pandas yields for the same cells: NaN when empty, floats in gappy columns
+        pandas_row = {
+            "Name": "Num",
+            "WP1": "fem",
+            "WP1 Benchmarked": float("nan"),
+            "WP2": "rom",
+            "WP2 Benchmarked": 1.0,
+        }
+        from_pandas = ExcelFetcher._parse_software_row(pandas_row, {})
+
+        assert [wp.benchmarked for wp in package.work_packages] == [False, True]
+        assert from_pandas.work_packages == package.work_packages
+
+
+class TestGenerationConfig:
+    """Tests for GenerationConfig."""
+
+    def test_frameworks_sorted_follows_changes(self, tmp_path):
+        """Test that the priority order reflects frameworks changed after loading."""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "frameworks:\n"
+            "  items:\n"
+            "    feelpp: {priority: 5}\n"
+            "    hawen: {priority: 1}\n"
+        )
+        config = GenerationConfig.from_yaml(path)
+        assert [f.slug for f in config.frameworks_sorted] == ["feelpp", "hawen"]
+
+        config.frameworks["samurai"] = FrameworkConfig(slug="samurai", priority=9)
+        config.frameworks["hawen"].priority = 7
+
+        assert [f.slug for f in config.frameworks_sorted] == ["samurai", "hawen", "feelpp"]
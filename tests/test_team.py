@@ -0,0 +1,285 @@
+"""Tests for recruited personnel (team) harvesting."""
+
+import io
+from datetime import datetime
+
+import openpyxl
+
+from harvest import team
+from harvest.team import (
+    Gender,
+    PositionType,
+    RecruitedCollection,
+    TeamFetcher,
+    generate_recruited_section,
+    parse_date,
+)
+
+SHEET_HEADER = [
+    "First name", "Surname", "Email", "Funded by Exa-MA", "Position", "WP", "Woman",
+    "Advisor", "Start date (if the person was not here from start)",
+    "End date (if the person has left)", "Other info", "Team", "Partner",
+    "Institution (employer)", "WP0", "WP1", "WP2", "WP3", "WP4", "WP5", "WP6", "WP7",
+]
+
+
+def _fetcher_for(rows: list[list]) -> TeamFetcher:
+    """Build a fetcher whose sheet holds the given rows below SHEET_HEADER."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "All Exa-MA"
+    ws.append(SHEET_HEADER)
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    fetcher = TeamFetcher("test-sheet-id")
+    fetcher._excel_data = buf.getvalue()
+    return fetcher
+
+
+def _person(first_name: str, surname: str, **row):
+    """Parse one 'All Exa-MA' sheet row into a RecruitedPerson."""
+    return TeamFetcher("test-sheet-id")._parse_row(
+        {"First name": first_name, "Surname": surname, **row}
+    )
+
+
+class TestParseDate:
+    """Tests for sheet date parsing."""
+
+    def test_iso_and_french_formats(self):
+        """Test ISO and DD/MM/YYYY dates, with or without a time part."""
+        assert parse_date("2024-03-15") == datetime(2024, 3, 15)
+        assert parse_date("2024-03-15 10:00:00") == datetime(2024, 3, 15)
+        assert parse_date("15/03/2024") == datetime(2024, 3, 15)
+        assert parse_date("1/3/2024") == datetime(2024, 3, 1)
+        assert parse_date("15-03-2024") == datetime(2024, 3, 15)
+
+    def test_month_year(self):
+        """Test English and French month-year dates."""
+        assert parse_date("March 2024") == datetime(2024, 3, 1)
+        assert parse_date("Jan 2024") == datetime(2024, 1, 1)
+        assert parse_date("mars 2024") == datetime(2024, 3, 1)
+        assert parse_date("Février 2025") == datetime(2025, 2, 1)
+
+    def test_invalid_and_empty(self):
+        """Test that unparseable and empty values give None."""
+        assert parse_date("2024-02-30") is None
+        assert parse_date("garbage") is None
+        assert parse_date("") is None
+        assert parse_date(None) is None
+        assert parse_date(float("nan")) is None
+        assert parse_date("   ") is None
+
+    def test_datetime_passthrough(self):
+        """Test that datetime cells are returned as is."""
+        value = datetime(2024, 1, 2, 3)
+
+        assert parse_date(value) is value
+
+
+class TestRecruitedCollection:
+    """Tests for RecruitedCollection groupings."""
+
+    def _collection(self) -> RecruitedCollection:
+        """Collection with a duplicate name, a past member and no-WP entry."""
+        return RecruitedCollection(personnel=[
+            _person("Marie", "Curie", WP1=1, Position="PhD", Partner="Unistra", Woman=1,
+                    **{"Funded by Exa-MA": 1}),
+            _person("Jean", "Dupont", WP2=1, Position="Post-doc", Partner="CNRS", Woman=0,
+                    **{"End date (if the person has left)": "01/01/2020"}),
+            _person("Marie", "Curie", WP3=1, Position="PhD", Partner="Unistra", Woman=1),
+            _person("Alex", "Martin", Position="PhD", Woman="?"),
+        ])
+
+    def test_summarize(self):
+        """Test that summarize() matches the individual views."""
+        collection = self._collection()
+
+        summary = collection.summarize()
+
+        assert summary.active == collection.active_personnel
+        assert summary.funded == collection.funded_personnel
+        assert summary.unique == collection.unique_personnel()
+        assert [p.full_name for p in summary.unique] == [
+            "Marie Curie", "Jean Dupont", "Alex Martin",
+        ]
+        assert [p.full_name for p in summary.active_unique] == ["Marie Curie", "Alex Martin"]
+        assert summary.by_work_package == collection.by_work_package()
+        assert list(summary.by_work_package) == ["WP1", "WP2", "WP3", "Unknown"]
+        assert summary.by_position == collection.by_position()
+        assert summary.by_partner == collection.by_partner()
+        assert list(summary.by_partner) == ["CNRS", "Unistra", "Unknown"]
+        assert summary.pos_counts == {PositionType.PHD: 3, PositionType.POSTDOC: 1}
+        assert summary.gender_stats == collection.gender_stats
+        assert summary.gender_stats.female == 2
+        assert summary.gender_stats.male == 1
+        assert summary.gender_stats.unknown == 1
+
+    def test_derived_views_are_cached(self):
+        """Test that derived views are computed once per collection."""
+        collection = self._collection()
+
+        assert collection.summarize() is collection.summarize()
+        assert collection.by_work_package() is collection.by_work_package()
+        assert collection.deduplicated() is collection.deduplicated()
+        assert collection.deduplicated(active_only=True) is not collection.deduplicated()
+
+    def test_cached_views_do_not_affect_equality(self):
+        """Test that filling the caches leaves model equality unchanged."""
+        collection = self._collection()
+        other = collection.model_copy(deep=True)
+
+        collection.summarize()
+        collection.by_position()
+        collection.by_partner()
+        collection.deduplicated()
+
+        assert collection == other
+        assert collection.model_dump() == other.model_dump()
+
+    def test_by_work_package_non_numeric_wp(self):
+        """Test that free-form WP values sort last instead of failing."""
+        collection = RecruitedCollection(personnel=[
+            _person("Ada", "Lovelace", WP="WP1/WP2"),
+            _person("Alan", "Turing", WP="WPx"),
+            _person("Grace", "Hopper", WP3=1),
+            _person("Emmy", "Noether"),
+        ])
+
+        groups = collection.by_work_package()
+
+        assert list(groups)[0] == "WP3"
+        assert set(groups) == {"WP3", "WP1/WP2", "WPx", "Unknown"}
+        assert list(collection.summarize().by_work_package) == list(groups)
+
+    def test_recruited_section_non_numeric_wp(self):
+        """Test that the recruited section renders with free-form WP values."""
+        collection = RecruitedCollection(personnel=[
+            _person("Ada", "Lovelace", WP="WP1/WP2", Position="PhD"),
+        ])
+
+        section = generate_recruited_section(collection)
+
+        assert "*Lovelace*" in section
+        assert "|WP1/WP2" in section
+
+
+class TestTeamFetcher:
+    """Tests for TeamFetcher sheet parsing."""
+
+    def test_fetch_streams_rows(self):
+        """Test fetching people from a streamed sheet."""
+        fetcher = _fetcher_for([
+            ["Marie", "Curie", "m@c", 1, "PhD", None, 1, "A; B\nC", "01/10/2023", None,
+             None, None, "Unistra", "CNRS", None, 1, None, 0.5, None, None, None, None],
+            ["Jean", "Dupont", None, "yes", "Post-doc", "WP1/WP2", 0, None,
+             datetime(2024, 2, 1), "March 2024", None, None, "INRIA", None,
+             None, None, 1, None, None, None, None, None],
+            ["NoSurname", None, None, 1, "PhD", None, None, None, None, None,
+             None, None, None, None, None, None, None, None, None, None, None, None],
+            ["Zoe", "Abc", None, None, "IR-CDD", None, None, None, None, None,
+             None, None, "CEA", None, None, "x", None, None, None, None, None, 2],
+        ])
+
+        collection = fetcher.fetch()
+
+        marie, jean, zoe = collection.personnel
+        assert marie.work_packages == ["WP1", "WP3"]
+        assert marie.funded_by_exama is True
+        assert marie.gender == Gender.FEMALE
+        assert marie.advisors == ["A", "B", "C"]
+        assert marie.start_date == datetime(2023, 10, 1)
+        assert marie.end_date is None
+        assert jean.work_packages == ["WP1/WP2"]
+        assert jean.position == PositionType.POSTDOC
+        assert jean.start_date == datetime(2024, 2, 1)
+        assert jean.end_date == datetime(2024, 3, 1)
+        assert zoe.work_packages == ["WP7"]  # Non-numeric WP cells are ignored
+        assert zoe.funded_by_exama is False
+        assert zoe.position == PositionType.RESEARCH_ENGINEER
+        assert [p.full_name for p in fetcher.fetch(funded_only=True).personnel] == [
+            "Marie Curie", "Jean Dupont",
+        ]
+
+    def test_fetch_first_duplicate_header_wins(self):
+        """Test that a repeated header keeps the first column's values."""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "All Exa-MA"
+        ws.append(["First name", "Surname", "Partner", "Partner"])
+        ws.append(["Ada", "Lovelace", "CNRS", "Inria"])
+        buf = io.BytesIO()
+        wb.save(buf)
+        fetcher = TeamFetcher("test-sheet-id")
+        fetcher._excel_data = buf.getvalue()
+
+        (person,) = fetcher.fetch().personnel
+
+        assert person.partner == "CNRS"
+
+    def test_fetch_blank_date_cells(self):
+        """Test that empty and whitespace-only date cells are treated as unset."""
+        fetcher = _fetcher_for([
+            ["Ada", "Lovelace", None, 1, "PhD", None, 1, None, None, "  ",
+             None, None, "CNRS", None, None, 1, None, None, None, None, None, None],
+        ])
+
+        (person,) = fetcher.fetch().personnel
+
+        assert person.start_date is None
+        assert person.end_date is None
+        assert person.is_active
+        assert person.start_date_display == "Project start"
+
+
+class _FakeResponse(io.BytesIO):
+    """Minimal urlopen response: a readable body usable as a context manager."""
+
+
+class TestSheetCache:
+    """Tests for the on-disk copy of the downloaded team sheet."""
+
+    def test_no_cache_by_default(self, tmp_path, monkeypatch):
+        """Test that without a cache_dir nothing is written to disk."""
+        monkeypatch.setattr(team._URL_OPENER, "open", lambda url: _FakeResponse(b"fresh"))
+        monkeypatch.setattr(team, "DEFAULT_SHEET_CACHE_DIR", tmp_path)
+        fetcher = TeamFetcher("test-sheet-id")
+
+        assert fetcher._cache_path() is None
+        assert fetcher._fetch_excel() == b"fresh"
+        assert not list(tmp_path.iterdir())
+
+    def test_fresh_copy_is_reused(self, tmp_path, monkeypatch, capsys):
+        """Test that a fresh cached sheet is read instead of downloaded."""
+        def fail(url):
+            raise AssertionError("should not download")
+
+        monkeypatch.setattr(team._URL_OPENER, "open", fail)
+        fetcher = TeamFetcher("test-sheet-id", cache_dir=tmp_path)
+        fetcher._cache_path().write_bytes(b"cached")
+
+        assert fetcher._fetch_excel() == b"cached"
+        assert "Using cached sheet test-sheet-id" in capsys.readouterr().out
+
+    def test_expired_copy_is_replaced(self, tmp_path, monkeypatch):
+        """Test that a cached sheet older than cache_ttl is downloaded again."""
+        monkeypatch.setattr(team._URL_OPENER, "open", lambda url: _FakeResponse(b"fresh"))
+        fetcher = TeamFetcher("test-sheet-id", cache_dir=tmp_path, cache_ttl=-1)
+        fetcher._cache_path().write_bytes(b"cached")
+
+        assert fetcher._fetch_excel() == b"fresh"
+        assert fetcher._cache_path().read_bytes() == b"fresh"
+
+    def test_force_refresh_downloads(self, tmp_path, monkeypatch):
+        """Test that force_refresh bypasses and replaces the cached sheet."""
+        monkeypatch.setattr(team._URL_OPENER, "open", lambda url: _FakeResponse(b"fresh"))
+        fetcher = TeamFetcher("test-sheet-id", cache_dir=tmp_path / "team", force_refresh=True)
+        fetcher.cache_dir.mkdir()
+        fetcher._cache_path().write_bytes(b"cached")
+
+        assert fetcher._fetch_excel() == b"fresh"
+        assert fetcher._cache_path().read_bytes() == b"fresh"
+        assert fetcher._cache_path().parent == tmp_path / "team"